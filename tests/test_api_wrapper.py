@@ -244,6 +244,165 @@ def test_schemas_endpoint(client: UCClient):
     assert len(client.list_schemas(catalog=default_catalog)) == 0
 
 
+def test_list_schemas_bulk(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    new_catalog = "asdgasdgasdgsa"
+    new_schema_names = ["sdfhsdfh", "dfhjdfhj", "fghkfghk"]
+
+    client.create_catalog(Catalog(name=new_catalog))
+    for schema_name in new_schema_names:
+        client.create_schema(Schema(name=schema_name, catalog_name=new_catalog))
+
+    schemas = client.list_schemas_bulk(catalogs=[default_catalog, new_catalog])
+    assert list(schemas.keys()) == [default_catalog, new_catalog]
+    assert [schema.name for schema in schemas[default_catalog]] == ["default"]
+    assert sorted(schema.name for schema in schemas[new_catalog]) == sorted(
+        new_schema_names
+    )
+
+    assert client.list_schemas_bulk(catalogs=[]) == {}
+
+    with pytest.raises(DoesNotExistError):
+        client.list_schemas_bulk(catalogs=[default_catalog, new_catalog + "asdf"])
+
+
+def test_list_tables_bulk(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    new_schema = "sdfhsdfh"
+
+    client.create_schema(Schema(name=new_schema, catalog_name=default_catalog))
+
+    tables = client.list_tables_bulk(
+        catalog=default_catalog, schemas=[default_schema, new_schema]
+    )
+    assert list(tables.keys()) == [default_schema, new_schema]
+    assert len(tables[default_schema]) == 4
+    assert tables[new_schema] == []
+
+    assert client.list_tables_bulk(catalog=default_catalog, schemas=[]) == {}
+
+    with pytest.raises(DoesNotExistError):
+        client.list_tables_bulk(
+            catalog=default_catalog, schemas=[default_schema, new_schema + "asdf"]
+        )
+
+
+def test_create_catalogs_bulk(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    new_catalog_names = ["asdgasdgasdgsa", "sdfhsdfhsdfh", "dfhjdfhjdfhj"]
+
+    catalogs = client.create_catalogs_bulk(
+        [Catalog(name=name, comment=name + "asd") for name in new_catalog_names]
+    )
+    assert [catalog.name for catalog in catalogs] == new_catalog_names
+    assert [catalog.comment for catalog in catalogs] == [
+        name + "asd" for name in new_catalog_names
+    ]
+    assert all(catalog.id is not None for catalog in catalogs)
+    assert len(client.list_catalogs()) == 4
+
+    assert client.create_catalogs_bulk([]) == []
+
+    with pytest.raises(AlreadyExistsError):
+        client.create_catalogs_bulk(
+            [Catalog(name="fghkfghkfghk"), Catalog(name=default_catalog)]
+        )
+    assert client.get_catalog("fghkfghkfghk").name == "fghkfghkfghk"
+
+
+def test_iter_catalogs_schemas_and_tables(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    new_catalog_names = ["asdgasdgasdgsa", "sdfhsdfhsdfh"]
+    new_schema_names = ["dfhjdfhj", "fghkfghk"]
+
+    for catalog_name in new_catalog_names:
+        client.create_catalog(Catalog(name=catalog_name))
+    for schema_name in new_schema_names:
+        client.create_schema(Schema(name=schema_name, catalog_name=default_catalog))
+
+    catalogs = client.iter_catalogs()
+    assert next(catalogs).name in [default_catalog] + new_catalog_names
+    assert [catalog.name for catalog in client.iter_catalogs()] == [
+        catalog.name for catalog in client.list_catalogs()
+    ]
+    assert len(list(client.iter_catalogs())) == 3
+
+    assert [schema.name for schema in client.iter_schemas(default_catalog)] == [
+        schema.name for schema in client.list_schemas(default_catalog)
+    ]
+    assert len(list(client.iter_schemas(default_catalog))) == 3
+
+    with pytest.raises(DoesNotExistError):
+        next(client.iter_schemas(default_catalog + "asdf"))
+
+    default_schema = "default"
+    assert [
+        table.name for table in client.iter_tables(default_catalog, default_schema)
+    ] == [table.name for table in client.list_tables(default_catalog, default_schema)]
+    assert next(client.iter_tables(default_catalog, default_schema)).name in [
+        table.name for table in client.list_tables(default_catalog, default_schema)
+    ]
+
+    with pytest.raises(DoesNotExistError):
+        next(client.iter_tables(default_catalog, default_schema + "asdf"))
+
+
+def test_shared_client(client: UCClient):
+    shared_client = UCClient.shared(uc_url=client.uc_url)
+    assert shared_client.health_check()
+    assert UCClient.shared(uc_url=client.uc_url + "/") is shared_client
+    assert shared_client is not client
+
+
+def test_catalog_cache(client: UCClient):
+    assert client.health_check()
+
+    cat_name = "asdasdasdasfdsadgsa"
+    cat_name_update = "asdgnlsavnsadn"
+    cached_client = UCClient(uc_url=client.uc_url, cache_ttl=60.0)
+
+    cached_client.create_catalog(Catalog(name=cat_name, comment="asd"))
+    cat = cached_client.get_catalog(cat_name)
+    assert cat.comment == "asd"
+
+    # Mutating the returned Catalog does not affect the cached one
+    cat.comment = "dfg"
+    assert cached_client.get_catalog(cat_name).comment == "asd"
+
+    # Changes made through another client are not seen until the cache is cleared
+    client.update_catalog(cat_name, Catalog(name=cat_name_update, comment="dfg"))
+    assert cached_client.get_catalog(cat_name).comment == "asd"
+    cached_client.clear_cache()
+    with pytest.raises(DoesNotExistError):
+        cached_client.get_catalog(cat_name)
+    assert cached_client.get_catalog(cat_name_update).comment == "dfg"
+
+    # Changes made through the caching client invalidate the cache
+    cached_client.update_catalog(cat_name_update, Catalog(name=cat_name, comment="x"))
+    with pytest.raises(DoesNotExistError):
+        cached_client.get_catalog(cat_name_update)
+    assert cached_client.get_catalog(cat_name).comment == "x"
+
+    cached_client.delete_catalog(cat_name)
+    with pytest.raises(DoesNotExistError):
+        cached_client.get_catalog(cat_name)
+
+    # Without a cache_ttl every call goes to the server
+    client.create_catalog(Catalog(name=cat_name, comment="y"))
+    assert client.get_catalog(cat_name).comment == "y"
+    cached_client.update_catalog(cat_name, Catalog(name=cat_name_update, comment="z"))
+    assert client.get_catalog(cat_name_update).comment == "z"
+
+
 def test_tables_endpoint(client: UCClient):
     assert client.health_check()
 
@@ -452,6 +611,123 @@ def test_tables_endpoint(client: UCClient):
         client.delete_table(default_catalog, default_schema, new_external_table.name)
 
 
+def test_table_cache(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "asdasdasdasfdsadgsa"
+    cached_client = UCClient(uc_url=client.uc_url, cache_ttl=60.0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        cached_client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type="parquet",
+            location="file://" + tmpdir + "/" + table_name + ".parquet",
+        )
+
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment is None
+
+        # Mutating the returned Table does not affect the cached one
+        table.comment = "asd"
+        table.columns.pop()
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment is None
+        assert [col.name for col in table.columns] == ["a"]
+
+        # Changes made through another client are not seen until the table is invalidated
+        client.update_table(
+            default_catalog, default_schema, table.model_copy(update={"comment": "asd"})
+        )
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment is None
+        cached_client.invalidate_table(default_catalog, default_schema, table_name)
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment == "asd"
+
+        # Changes made through the caching client invalidate the cache
+        cached_client.update_table(
+            default_catalog, default_schema, table.model_copy(update={"comment": "dfg"})
+        )
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment == "dfg"
+
+        cached_client.write_table(
+            df=df.with_columns(b=pl.lit("x")),
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="overwrite",
+        )
+        table = cached_client.get_table(default_catalog, default_schema, table_name)
+        assert [col.name for col in table.columns] == ["a", "b"]
+        assert cached_client.read_table(
+            default_catalog, default_schema, table_name
+        ).columns == ["a", "b"]
+
+        # Listing the tables of a schema caches them
+        listing_client = UCClient(uc_url=client.uc_url, cache_ttl=60.0)
+        listing_client.prewarm_schema(default_catalog, default_schema)
+        client.update_table(
+            default_catalog, default_schema, table.model_copy(update={"comment": "ghj"})
+        )
+        table = listing_client.get_table(default_catalog, default_schema, table_name)
+        assert table.comment == "dfg"
+
+        cached_client.delete_table(default_catalog, default_schema, table_name)
+        with pytest.raises(DoesNotExistError):
+            cached_client.get_table(default_catalog, default_schema, table_name)
+
+
+def test_delta_table_cache(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "asdasdasdasfdsadgsa"
+    cached_client = UCClient(uc_url=client.uc_url, cache_ttl=60.0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        df = pl.DataFrame({"a": [1, 2, 3]})
+        cached_client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            location="file://" + tmpdir,
+        )
+
+        dt = cached_client.get_delta_table(default_catalog, default_schema, table_name)
+        assert dt.version() == 0
+
+        # The cached DeltaTable is reused and brought up to date
+        client.write_table(
+            df=df, catalog=default_catalog, schema=default_schema, name=table_name
+        )
+        dt2 = cached_client.get_delta_table(default_catalog, default_schema, table_name)
+        assert dt2 is dt
+        assert dt2.version() == 1
+
+        # Without a cache_ttl a new DeltaTable is loaded every time
+        dt3 = client.get_delta_table(default_catalog, default_schema, table_name)
+        assert dt3 is not client.get_delta_table(
+            default_catalog, default_schema, table_name
+        )
+        assert dt3.version() == 1
+
+        cached_client.invalidate_table(default_catalog, default_schema, table_name)
+        assert (
+            cached_client.get_delta_table(default_catalog, default_schema, table_name)
+            is not dt
+        )
+
+
 def test_overwrite_table(client: UCClient):
     assert client.health_check()
 
@@ -587,6 +863,53 @@ def test_sync_delta_properties(
         assert table.properties == {"asd": "foo"}
 
 
+def test_sync_delta_properties_cache(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "asdasdasdasfdsadgsa"
+    cached_client = UCClient(uc_url=client.uc_url, cache_ttl=60.0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cached_client.create_as_table(
+            df=pl.DataFrame({"id": [1, 2, 3]}),
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            location="file://" + tmpdir,
+        )
+
+        dt = cached_client.get_delta_table(default_catalog, default_schema, table_name)
+        dt.alter.add_constraint(constraints={"id_positive": "id > 0"})
+        table = cached_client.sync_delta_properties(
+            default_catalog, default_schema, table_name
+        )
+        assert table.properties is not None
+        assert len(table.properties) == 1
+
+        # The Delta table has not changed, so the second sync is skipped
+        assert (
+            cached_client.sync_delta_properties(
+                default_catalog, default_schema, table_name
+            )
+            == table
+        )
+
+        # Properties overwritten in Unity Catalog are synced again
+        table.properties = {"asd": "foo"}
+        cached_client.update_table(default_catalog, default_schema, table)
+        table = cached_client.sync_delta_properties(
+            default_catalog, default_schema, table_name
+        )
+        assert table.properties is not None
+        assert len(table.properties) == 2
+        assert (
+            client.get_table(default_catalog, default_schema, table_name).properties
+            == table.properties
+        )
+
+
 def assert_table_matches(client: UCClient, default_table: Table):
     table = client.get_table(
         catalog=default_table.catalog_name,
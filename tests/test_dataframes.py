@@ -398,6 +398,395 @@ def test_partitioned_dataframe_operations(
         assert_frame_equal(pl.LazyFrame(df5), df5_scan, check_row_order=False)
 
 
+def test_partitioned_parquet_large_write(client: UCClient):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    # More rows in a single partition than PyArrow's default max_rows_per_group
+    n_rows = 1_100_000
+    df = pl.DataFrame(
+        {
+            "id": pl.int_range(n_rows, eager=True),
+            "part": [0] * (n_rows - 2) + [1, 2],
+        },
+        schema={"id": pl.Int64, "part": pl.Int64},
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client.create_table(
+            Table(
+                name=table_name,
+                catalog_name=default_catalog,
+                schema_name=default_schema,
+                table_type=TableType.EXTERNAL,
+                file_type=FileType.PARQUET,
+                columns=[
+                    Column(
+                        name="id", data_type=DataType.LONG, position=0, nullable=False
+                    ),
+                    Column(
+                        name="part",
+                        data_type=DataType.LONG,
+                        position=1,
+                        nullable=False,
+                        partition_index=0,
+                    ),
+                ],
+                storage_location=tmpdir,
+            )
+        )
+
+        client.write_table(
+            df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="strict",
+        )
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+        client.write_table(
+            df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="append",
+            schema_evolution="strict",
+        )
+        assert_frame_equal(
+            pl.concat([df, df]),
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+
+def test_partitioned_parquet_ignores_other_files(
+    client: UCClient,
+    random_partitioned_df: Callable[[], pl.DataFrame],
+    random_partitioned_df_cols: list[Column],
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        client.create_table(
+            Table(
+                name=table_name,
+                catalog_name=default_catalog,
+                schema_name=default_schema,
+                table_type=TableType.EXTERNAL,
+                file_type=FileType.PARQUET,
+                columns=random_partitioned_df_cols,
+                storage_location=tmpdir,
+            )
+        )
+
+        df = random_partitioned_df()
+        client.write_table(
+            df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="strict",
+        )
+
+        # Files that are not Parquet should not break reading the table
+        with open(os.path.join(tmpdir, "_SUCCESS"), "w"):
+            pass
+        partition_dir = next(
+            entry.path for entry in os.scandir(tmpdir) if entry.is_dir()
+        )
+        with open(os.path.join(partition_dir, "notes.txt"), "w") as f:
+            f.write("not parquet")
+
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+        assert_frame_equal(
+            pl.LazyFrame(df),
+            client.scan_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+
+def test_partitioned_parquet_under_partition_like_directory(
+    client: UCClient,
+    random_partitioned_df: Callable[[], pl.DataFrame],
+    random_partitioned_df_cols: list[Column],
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # Ancestors of the table directory that look like hive partitions must not be
+        # parsed as partition columns.
+        filepath = os.path.join(tmpdir, "env=prod", table_name)
+        os.makedirs(filepath)
+        client.create_table(
+            Table(
+                name=table_name,
+                catalog_name=default_catalog,
+                schema_name=default_schema,
+                table_type=TableType.EXTERNAL,
+                file_type=FileType.PARQUET,
+                columns=random_partitioned_df_cols,
+                storage_location=filepath,
+            )
+        )
+
+        df = random_partitioned_df()
+        client.write_table(
+            df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="strict",
+        )
+
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+        assert_frame_equal(
+            pl.LazyFrame(df),
+            client.scan_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+        # Files that are not Parquet should not break reading the table either
+        partition_dir = next(
+            entry.path for entry in os.scandir(filepath) if entry.is_dir()
+        )
+        with open(os.path.join(partition_dir, "notes.txt"), "w") as f:
+            f.write("not parquet")
+
+        predicate = pl.col("part1") == 1
+        assert_frame_equal(
+            df.filter(predicate).select(["id", "part2"]),
+            client.scan_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                columns=["id", "part2"],
+                predicate=predicate,
+            ).collect(),
+            check_row_order=False,
+        )
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "file_type,partitioned",
+    [
+        (FileType.DELTA, False),
+        (FileType.PARQUET, False),
+        (FileType.DELTA, True),
+        (FileType.PARQUET, True),
+        (FileType.CSV, False),
+        (FileType.AVRO, False),
+    ],
+)
+def test_write_lazyframe(
+    client: UCClient,
+    random_partitioned_df: Callable[[], pl.DataFrame],
+    file_type: FileType,
+    partitioned: bool,
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        match file_type:
+            case FileType.DELTA:
+                filepath = tmpdir
+            case FileType.PARQUET:
+                filepath = (
+                    tmpdir
+                    if partitioned
+                    else os.path.join(tmpdir, table_name + ".parquet")
+                )
+            case FileType.CSV:
+                filepath = os.path.join(tmpdir, table_name + ".csv")
+            case FileType.AVRO:
+                filepath = os.path.join(tmpdir, table_name + ".avro")
+            case _:
+                raise NotImplementedError
+
+        df = random_partitioned_df()
+        # Polars does not support DECIMAL when reading CSVs
+        if file_type == FileType.CSV:
+            df = df.cast({"decimals": pl.Float64})
+
+        client.create_as_table(
+            df=df.lazy(),
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type=file_type,
+            table_type="external",
+            location="file://" + filepath,
+            partition_cols=["part1", "part2"] if partitioned else None,
+        )
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+        # Overwriting a table with a LazyFrame that reads the same table
+        if file_type == FileType.AVRO:
+            lf = client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ).lazy()
+        else:
+            lf = client.scan_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            )
+        predicate = pl.col("ints") > 5000
+        client.write_table(
+            lf.filter(predicate),
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="strict",
+        )
+        expected = df.filter(predicate)
+        if file_type == FileType.PARQUET and partitioned:
+            # Partitioned Parquet only overwrites the partitions that were written to
+            expected = pl.concat(
+                [
+                    expected,
+                    df.join(expected, on=["part1", "part2"], how="anti"),
+                ]
+            )
+        assert_frame_equal(
+            expected,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "file_type",
+    [
+        FileType.PARQUET,
+        FileType.CSV,
+    ],
+)
+def test_write_delta_scan_to_single_file(
+    client: UCClient,
+    random_df: Callable[[], pl.DataFrame],
+    file_type: FileType,
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    delta_table_name = "test_delta_table"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        df = random_df()
+        # Polars does not support DECIMAL when reading CSVs
+        if file_type == FileType.CSV:
+            df = df.cast({"decimals": pl.Float64})
+
+        client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=delta_table_name,
+            file_type=FileType.DELTA,
+            table_type="external",
+            location="file://" + os.path.join(tmpdir, delta_table_name),
+        )
+
+        # The streaming engine cannot sink a scan of a Delta table, so the write has
+        # to fall back to collecting the LazyFrame.
+        lf = client.scan_table(
+            catalog=default_catalog, schema=default_schema, name=delta_table_name
+        )
+        extension = ".parquet" if file_type == FileType.PARQUET else ".csv"
+        client.create_as_table(
+            df=lf,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type=file_type,
+            table_type="external",
+            location="file://" + os.path.join(tmpdir, table_name + extension),
+        )
+        assert_frame_equal(
+            df,
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+        predicate = pl.col("ints") > 5000
+        client.write_table(
+            lf.filter(predicate),
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            mode="overwrite",
+            schema_evolution="strict",
+        )
+        assert_frame_equal(
+            df.filter(predicate),
+            client.read_table(
+                catalog=default_catalog, schema=default_schema, name=table_name
+            ),
+            check_row_order=False,
+        )
+
+
 @pytest.mark.parametrize(
     "file_type,partitioned",
     [
@@ -489,6 +878,213 @@ def test_create_as_table(
         assert_frame_equal(df, df_read, check_row_order=False)
 
 
+@pytest.mark.parametrize(
+    "file_type",
+    [
+        FileType.DELTA,
+        FileType.PARQUET,
+        FileType.CSV,
+        FileType.AVRO,
+    ],
+)
+def test_iter_table(
+    client: UCClient,
+    random_df: Callable[[], pl.DataFrame],
+    file_type: FileType,
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        match file_type:
+            case FileType.DELTA:
+                filepath = tmpdir
+            case FileType.PARQUET:
+                filepath = os.path.join(tmpdir, table_name + ".parquet")
+            case FileType.CSV:
+                filepath = os.path.join(tmpdir, table_name + ".csv")
+            case FileType.AVRO:
+                filepath = os.path.join(tmpdir, table_name + ".avro")
+            case _:
+                raise NotImplementedError
+
+        df = pl.concat([random_df() for _ in range(3)], rechunk=True)
+        # Polars does not support DECIMAL when reading CSVs
+        if file_type == FileType.CSV:
+            df = df.cast({"decimals": pl.Float64})
+
+        client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type=file_type,
+            table_type="external",
+            location="file://" + filepath,
+        )
+
+        batch_size = 7
+        batches = list(
+            client.iter_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                batch_size=batch_size,
+            )
+        )
+        assert len(batches) > 1
+        assert all(batch.height <= batch_size for batch in batches)
+        assert_frame_equal(df, pl.concat(batches), check_row_order=False)
+
+
+def test_iter_table_partitioned_parquet(
+    client: UCClient,
+    random_partitioned_df: Callable[[], pl.DataFrame],
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        df = pl.concat([random_partitioned_df() for _ in range(3)], rechunk=True)
+        client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type=FileType.PARQUET,
+            table_type="external",
+            location="file://" + tmpdir,
+            partition_cols=["part1", "part2"],
+        )
+
+        batch_size = 7
+        batches = list(
+            client.iter_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                batch_size=batch_size,
+            )
+        )
+        assert len(batches) > 1
+        assert all(batch.height <= batch_size for batch in batches)
+        assert_frame_equal(df, pl.concat(batches), check_row_order=False)
+
+
+@pytest.mark.parametrize(
+    "file_type",
+    [
+        FileType.DELTA,
+        FileType.PARQUET,
+        FileType.CSV,
+        FileType.AVRO,
+    ],
+)
+def test_read_table_columns_and_predicate(
+    client: UCClient,
+    random_df: Callable[[], pl.DataFrame],
+    file_type: FileType,
+):
+    assert client.health_check()
+
+    default_catalog = "unity"
+    default_schema = "default"
+    table_name = "test_table"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        match file_type:
+            case FileType.DELTA:
+                filepath = tmpdir
+            case FileType.PARQUET:
+                filepath = os.path.join(tmpdir, table_name + ".parquet")
+            case FileType.CSV:
+                filepath = os.path.join(tmpdir, table_name + ".csv")
+            case FileType.AVRO:
+                filepath = os.path.join(tmpdir, table_name + ".avro")
+            case _:
+                raise NotImplementedError
+
+        df = random_df()
+        # Polars does not support DECIMAL when reading CSVs
+        if file_type == FileType.CSV:
+            df = df.cast({"decimals": pl.Float64})
+
+        client.create_as_table(
+            df=df,
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            file_type=file_type,
+            table_type="external",
+            location="file://" + filepath,
+        )
+
+        columns = ["id", "floats"]
+        predicate = pl.col("ints") > 5000
+
+        assert_frame_equal(
+            df.select(columns),
+            client.read_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                columns=columns,
+            ),
+            check_row_order=False,
+        )
+        assert_frame_equal(
+            df.filter(predicate),
+            client.read_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                predicate=predicate,
+            ),
+            check_row_order=False,
+        )
+        # The predicate may use columns that are not selected
+        assert_frame_equal(
+            df.filter(predicate).select(columns),
+            client.read_table(
+                catalog=default_catalog,
+                schema=default_schema,
+                name=table_name,
+                columns=columns,
+                predicate=predicate,
+            ),
+            check_row_order=False,
+        )
+        limited = client.read_table(
+            catalog=default_catalog,
+            schema=default_schema,
+            name=table_name,
+            columns=columns,
+            predicate=predicate,
+            row_limit=3,
+        )
+        assert limited.columns == columns
+        assert len(limited) == min(3, len(df.filter(predicate)))
+
+        if file_type != FileType.AVRO:
+            assert_frame_equal(
+                df.filter(predicate).select(columns),
+                client.scan_table(
+                    catalog=default_catalog,
+                    schema=default_schema,
+                    name=table_name,
+                    columns=columns,
+                    predicate=predicate,
+                ).collect(),
+                check_row_order=False,
+            )
+
+
 @pytest.mark.parametrize(
     "file_type,partitioned",
     [
@@ -65,3 +65,14 @@ def test_sql(
                 f"FROM {cat_name}.{default_schema}.{table_name} WHERE source = 1"
             ).pl()
             assert_frame_equal(df1, df_sql2, check_row_order=False)
+
+            df_sql3 = client.sql(
+                f"FROM {cat_name}.{default_schema}.{table_name} WHERE source = ?",
+                params=[2],
+            ).pl()
+            assert_frame_equal(df2, df_sql3, check_row_order=False)
+
+            df_duckdb = client.read_table_via_duckdb(
+                catalog=cat_name, schema=default_schema, name=table_name
+            )
+            assert_frame_equal(pl.concat([df1, df2]), df_duckdb, check_row_order=False)
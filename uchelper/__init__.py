@@ -1,9 +1,18 @@
 from .client import UCClient
-from .models import Catalog, Schema, TableType, FileType, Table, DataType, Column
+from .models import (
+    Catalog,
+    Schema,
+    TableType,
+    FileType,
+    Table,
+    DataType,
+    Column,
+    WriteMode,
+    SchemaEvolution,
+)
 from .exceptions import (
     AlreadyExistsError,
     DoesNotExistError,
     UnsupportedOperationError,
     SchemaMismatchError,
 )
-from .dataframe import WriteMode, SchemaEvolution
@@ -1,22 +1,22 @@
+from __future__ import annotations
+
+import threading
 import requests
-import polars as pl
-import duckdb
-from typing import Literal, Any
-from deltalake import DeltaTable
-from deltalake.table import TableMerger
+from collections.abc import Iterator
+from typing import Literal, Any, TYPE_CHECKING
 from .exceptions import UnsupportedOperationError, DuckDBConnectionSetupError
-from .models import Catalog, Schema, Table, TableType, FileType
-from .dataframe import (
+from .models import (
+    Catalog,
+    Schema,
+    Table,
+    TableType,
+    FileType,
     WriteMode,
     SchemaEvolution,
-    read_table,
-    scan_table,
-    write_table,
-    df_schema_to_uc_schema,
-    merge_table,
 )
 from .uc_api_wrapper import (
     create_catalog,
+    create_catalogs_bulk,
     create_schema,
     create_table,
     delete_catalog,
@@ -26,9 +26,15 @@ from .uc_api_wrapper import (
     get_schema,
     get_table,
     health_check,
+    iter_catalogs,
+    iter_schemas,
+    iter_tables,
     list_catalogs,
     list_schemas,
+    list_schemas_bulk,
+    list_tables_bulk,
     list_tables,
+    make_session,
     update_catalog,
     update_schema,
     overwrite_table,
@@ -42,31 +48,60 @@ from .utils import (
     literal_to_schemaevolution,
     literal_to_tabletype,
     literal_to_writemode,
+    TTLCache,
 )
 import logging
 
+# Polars, deltalake, and DuckDB are slow to import, so they (and the .dataframe module that
+# depends on them) are only imported in the methods that actually use them.
+if TYPE_CHECKING:
+    import duckdb
+    import polars as pl
+    from deltalake import DeltaTable
+    from deltalake.table import TableMerger
+
 logger = logging.getLogger(__name__)
 
+# In-memory DuckDB databases set up to connect to Unity Catalog, keyed by Unity Catalog URL.
+# Setting one up installs/loads extensions and attaches the catalog, which is slow, so it is
+# done once per process and URL, and shared by all UCClients connecting to the same URL.
+_DUCKDB_DATABASES: dict[str, duckdb.DuckDBPyConnection] = {}
+_DUCKDB_DATABASES_LOCK = threading.Lock()
 
-class UCClient:
+
+# UCClients returned by UCClient.shared, keyed by Unity Catalog URL.
+_SHARED_CLIENTS: dict[str, UCClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _quote_identifier(identifier: str) -> str:
     """
-    A UCCLient object
-        - holds the connections to the Unity Catalog (requests Session, DuckDB connection),
-        - exposes methods for interacting with the Unity Catalog.
+    Quotes `identifier` for use as an identifier in a DuckDB query.
     """
+    return '"' + identifier.replace('"', '""') + '"'
 
-    def __init__(self, uc_url: str = "http://localhost:8080") -> None:
-        self.uc_url = uc_url.removesuffix("/")
-        self.session = requests.Session()
 
-        self.conn: duckdb.DuckDBPyConnection | None
+def _shared_duckdb(uc_url: str) -> duckdb.DuckDBPyConnection:
+    """
+    Returns the shared DuckDB connection set up to connect to the Unity Catalog at `uc_url`,
+    setting it up if this is the first time it is needed.
+    """
+    with _DUCKDB_DATABASES_LOCK:
+        conn = _DUCKDB_DATABASES.get(uc_url)
+        if conn is not None:
+            return conn
+
+        import duckdb
+
+        conn = duckdb.connect()
         try:
-            self.conn = duckdb.connect()
-            duckdb_uc_setup = f"""
-    install uc_catalog from core_nightly;
-    load uc_catalog;
-    install delta;
-    load delta;
+            # The extensions are usually installed already; only install if loading fails.
+            conn.sql("load uc_catalog; load delta;")
+        except duckdb.Error:
+            conn.sql(
+                "install uc_catalog from core_nightly; load uc_catalog; install delta; load delta;"
+            )
+        duckdb_uc_setup = f"""
     CREATE SECRET (
         TYPE UC,
         TOKEN 'not-used',
@@ -75,16 +110,128 @@ class UCClient:
     );
     ATTACH 'unity' AS unity (TYPE UC_CATALOG);
     """
-            self.conn.sql(duckdb_uc_setup)
-        except:
-            logger.warning("Failed to create a DuckDB connection to Unity Catalog.")
-            self.conn = None
+        conn.sql(duckdb_uc_setup)
+        _DUCKDB_DATABASES[uc_url] = conn
+        return conn
+
+
+class UCClient:
+    """
+    A UCCLient object
+        - holds the connections to the Unity Catalog (requests Session, DuckDB connection),
+        - exposes methods for interacting with the Unity Catalog.
+    """
+
+    def __init__(
+        self, uc_url: str = "http://localhost:8080", cache_ttl: float = 0.0
+    ) -> None:
+        self.uc_url = uc_url.removesuffix("/")
+        self.session = make_session()
+        # Metadata fetched from Unity Catalog is cached for `cache_ttl` seconds;
+        # 0 disables caching. The caches only see changes made through this client.
+        self._catalog_cache: TTLCache[str, Catalog] = TTLCache(cache_ttl)
+        self._table_cache: TTLCache[tuple[str, str, str], Table] = TTLCache(cache_ttl)
+        self._health_cache: TTLCache[str, bool] = TTLCache(cache_ttl)
+        # DeltaTables by table, with the storage location they were loaded from
+        self._delta_table_cache: TTLCache[
+            tuple[str, str, str], tuple[str | None, DeltaTable]
+        ] = TTLCache(cache_ttl)
+        # Delta version of each table at its last sync_delta_properties, with the Table
+        # that sync put in _table_cache
+        self._delta_sync_cache: TTLCache[tuple[str, str, str], tuple[int, Table]] = (
+            TTLCache(cache_ttl)
+        )
+
+        # The DuckDB connection is only set up on first use, see `conn`.
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._conn_initialized = False
+        self._conn_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, uc_url: str = "http://localhost:8080") -> UCClient:
+        """
+        Returns a UCClient for `uc_url` that is shared by the whole process, creating it on
+        the first call. Useful e.g. in web handlers, where creating a new client per request
+        would throw away the pooled HTTP connections every time.
+        """
+        uc_url = uc_url.removesuffix("/")
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(uc_url)
+            if client is None:
+                client = cls(uc_url=uc_url)
+                _SHARED_CLIENTS[uc_url] = client
+            return client
+
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection | None:
+        """
+        The DuckDB connection set up to connect to Unity Catalog, or None if setting it up
+        failed. Loading the DuckDB extensions is slow, so the connection is only created the
+        first time it is needed. A failed setup is not retried by this client.
+        """
+        if not self._conn_initialized:
+            with self._conn_lock:
+                if not self._conn_initialized:
+                    self._conn = self._connect_duckdb()
+                    self._conn_initialized = True
+        return self._conn
+
+    def _connect_duckdb(self) -> duckdb.DuckDBPyConnection | None:
+        import duckdb
+
+        try:
+            # A cursor is a separate connection to the shared database, so this client
+            # can use it independently of other clients, e.g. from another thread.
+            return _shared_duckdb(self.uc_url).cursor()
+        except (duckdb.Error, OSError) as e:
+            logger.warning(
+                "Failed to create a DuckDB connection to Unity Catalog: %s", e
+            )
+            return None
+
+    def prewarm_connection(self) -> None:
+        """
+        Opens a connection to Unity Catalog so that the next request finds it already in
+        the connection pool. Useful e.g. at the startup of a long-running process; the
+        client does not do this on its own. Failures are logged, not raised.
+        """
+        try:
+            self.session.head(self.uc_url, timeout=2)
+        except requests.RequestException as e:
+            logger.warning("Failed to prewarm the connection to Unity Catalog: %s", e)
 
     def health_check(self) -> bool:
         """
         Checks that Unity Catalog is running at the specified address.
+
+        If the client was created with a `cache_ttl`, a successful check is remembered for
+        that long; failed checks are never cached.
+        """
+        if self._health_cache.get(self.uc_url):
+            return True
+        healthy = health_check(session=self.session, uc_url=self.uc_url)
+        if healthy:
+            self._health_cache.put(self.uc_url, True)
+        return healthy
+
+    def clear_cache(self) -> None:
         """
-        return health_check(session=self.session, uc_url=self.uc_url)
+        Drops all cached Unity Catalog metadata, so the next lookups go to the server.
+        """
+        self._catalog_cache.clear()
+        self._table_cache.clear()
+        self._health_cache.clear()
+        self._delta_table_cache.clear()
+        self._delta_sync_cache.clear()
+
+    def invalidate_table(self, catalog: str, schema: str, name: str) -> None:
+        """
+        Drops the cached info of the table `catalog.schema.name`, so the next lookup
+        goes to the server.
+        """
+        self._table_cache.pop((catalog, schema, name))
+        self._delta_table_cache.pop((catalog, schema, name))
+        self._delta_sync_cache.pop((catalog, schema, name))
 
     def create_catalog(self, catalog: Catalog) -> Catalog:
         """
@@ -97,8 +244,22 @@ class UCClient:
             - id.
         Raises an AlreadyExistsError if a catalog with the name already exists.
         """
+        self._catalog_cache.pop(catalog.name)
         return create_catalog(session=self.session, uc_url=self.uc_url, catalog=catalog)
 
+    def create_catalogs_bulk(self, catalogs: list[Catalog]) -> list[Catalog]:
+        """
+        Creates all the catalogs in `catalogs` concurrently and returns the created Catalogs
+        in the same order.
+        If creating any of the catalogs fails, e.g. with an AlreadyExistsError, the first
+        error is raised once all requests have finished; the other catalogs are still created.
+        """
+        for catalog in catalogs:
+            self._catalog_cache.pop(catalog.name)
+        return create_catalogs_bulk(
+            session=self.session, uc_url=self.uc_url, catalogs=catalogs
+        )
+
     def delete_catalog(self, name: str, force: bool = False) -> bool:
         """
         Deletes the catalog with the specified name.`
@@ -108,10 +269,19 @@ class UCClient:
 
         Returns True/False indicating if a catalog was deleted.
         """
+        self._catalog_cache.pop(name)
+        self._table_cache.clear()
         return delete_catalog(
             session=self.session, uc_url=self.uc_url, name=name, force=force
         )
 
+    def iter_catalogs(self) -> Iterator[Catalog]:
+        """
+        Returns an iterator of the catalogs in the specified Unity Catalog.
+        Catalogs are fetched lazily page by page while iterating.
+        """
+        return iter_catalogs(session=self.session, uc_url=self.uc_url)
+
     def list_catalogs(self) -> list[Catalog]:
         """
         Returns a list of catalogs from the specified Unity Catalog.
@@ -122,8 +292,15 @@ class UCClient:
         """
         Returns the info of the catalog with the specified name, if it exists.
         Raises a DoesNotExistError if a catalog with the name does not exist.
+
+        If the client was created with a `cache_ttl`, the result is served from the cache
+        while it is fresh.
         """
-        return get_catalog(session=self.session, uc_url=self.uc_url, name=name)
+        catalog = self._catalog_cache.get(name)
+        if catalog is None:
+            catalog = get_catalog(session=self.session, uc_url=self.uc_url, name=name)
+            self._catalog_cache.put(name, catalog)
+        return catalog.model_copy(deep=True)
 
     def update_catalog(self, name: str, catalog: Catalog) -> Catalog:
         """
@@ -136,6 +313,9 @@ class UCClient:
         Raises an AlreadyExistsError if the new name is the same as the old name. Unity Catalog
         does not allow updating and keeping the same name atm.
         """
+        self._catalog_cache.pop(name)
+        self._catalog_cache.pop(catalog.name)
+        self._table_cache.clear()
         return update_catalog(
             session=self.session, uc_url=self.uc_url, name=name, catalog=catalog
         )
@@ -162,6 +342,7 @@ class UCClient:
         Returns True/False indicating if a schema was deleted.
         Raises a DoesNotExistError if a schema with the name does not exist.
         """
+        self._table_cache.clear()
         return delete_schema(
             session=self.session,
             uc_url=self.uc_url,
@@ -179,12 +360,30 @@ class UCClient:
             session=self.session, uc_url=self.uc_url, catalog=catalog, schema=schema
         )
 
+    def iter_schemas(self, catalog: str) -> Iterator[Schema]:
+        """
+        Returns an iterator of the schemas in the specified catalog from Unity Catalog.
+        Schemas are fetched lazily page by page while iterating.
+        Raises a DoesNotExistError if the catalog does not exist.
+        """
+        return iter_schemas(session=self.session, uc_url=self.uc_url, catalog=catalog)
+
     def list_schemas(self, catalog: str) -> list[Schema]:
         """
         Returns a list of schemas in the specified catalog from Unity Catalog.
         """
         return list_schemas(session=self.session, uc_url=self.uc_url, catalog=catalog)
 
+    def list_schemas_bulk(self, catalogs: list[str]) -> dict[str, list[Schema]]:
+        """
+        Returns the schemas in each of the specified catalogs, keyed by catalog name.
+        The catalogs are listed concurrently.
+        Raises a DoesNotExistError if any of the catalogs does not exist.
+        """
+        return list_schemas_bulk(
+            session=self.session, uc_url=self.uc_url, catalogs=catalogs
+        )
+
     def update_schema(
         self, catalog: str, schema_name: str, new_schema: Schema
     ) -> Schema:
@@ -199,6 +398,7 @@ class UCClient:
         Raises an AlreadyExistsError if there already exists a schema with the new name
         in the same catalog.
         """
+        self._table_cache.clear()
         return update_schema(
             uc_url=self.uc_url,
             session=self.session,
@@ -222,6 +422,7 @@ class UCClient:
         Returns a new Table with the remaining fields populated.
         Raises an AlreadyExistsError if a Table with the name already exists in the same catalog.
         """
+        self._table_cache.pop((table.catalog_name, table.schema_name, table.name))
         return create_table(session=self.session, uc_url=self.uc_url, table=table)
 
     def delete_table(
@@ -234,6 +435,8 @@ class UCClient:
         Deletes the table.
         Raises a DoesNotExistError if the table did not exist.
         """
+        self._table_cache.pop((catalog, schema, table))
+        self._delta_table_cache.pop((catalog, schema, table))
         return delete_table(
             session=self.session,
             uc_url=self.uc_url,
@@ -251,22 +454,96 @@ class UCClient:
         """
         Returns the info of the table, if it exists.
         Raises a DoesNotExistException if the table does not exist.
+
+        If the client was created with a `cache_ttl`, the result is served from the cache
+        while it is fresh.
         """
-        return get_table(
-            session=self.session,
-            uc_url=self.uc_url,
-            catalog=catalog,
-            schema=schema,
-            table=table,
+        return self._get_table(catalog=catalog, schema=schema, table=table).model_copy(
+            deep=True
+        )
+
+    def _get_table(self, catalog: str, schema: str, table: str) -> Table:
+        """
+        Returns the info of the table from the cache if it is fresh, otherwise from
+        Unity Catalog. The returned Table may be shared with the cache, so it must not
+        be mutated; `get_table` returns a copy for callers.
+        """
+        key = (catalog, schema, table)
+        table_info = self._table_cache.get(key)
+        if table_info is None:
+            table_info = get_table(
+                session=self.session,
+                uc_url=self.uc_url,
+                catalog=catalog,
+                schema=schema,
+                table=table,
+            )
+            self._table_cache.put(key, table_info)
+        return table_info
+
+    def iter_tables(self, catalog: str, schema: str) -> Iterator[Table]:
+        """
+        Returns an iterator of the tables in the specified catalog.schema from Unity Catalog.
+        Tables are fetched lazily page by page while iterating.
+        Raises a DoesNotExistError if the catalog or schema does not exist.
+
+        If the client was created with a `cache_ttl`, the listed tables are also cached, so
+        subsequent lookups of them do not need to go to the server.
+        """
+        tables = iter_tables(
+            session=self.session, uc_url=self.uc_url, catalog=catalog, schema=schema
         )
+        if self._table_cache.ttl <= 0:
+            return tables
+        return self._cache_tables(catalog=catalog, schema=schema, tables=tables)
+
+    def _cache_tables(
+        self, catalog: str, schema: str, tables: Iterator[Table]
+    ) -> Iterator[Table]:
+        for table in tables:
+            self._table_cache.put(
+                (catalog, schema, table.name), table.model_copy(deep=True)
+            )
+            yield table
 
     def list_tables(self, catalog: str, schema: str) -> list[Table]:
         """
         Returns a list of tables in the specified catalog.schema from Unity Catalog.
+
+        If the client was created with a `cache_ttl`, the listed tables are also cached, so
+        subsequent lookups of them do not need to go to the server.
         """
-        return list_tables(
-            session=self.session, uc_url=self.uc_url, catalog=catalog, schema=schema
+        return list(self.iter_tables(catalog=catalog, schema=schema))
+
+    def list_tables_bulk(
+        self, catalog: str, schemas: list[str]
+    ) -> dict[str, list[Table]]:
+        """
+        Returns the tables in each of the specified schemas of `catalog`, keyed by schema name.
+        The schemas are listed concurrently.
+        Raises a DoesNotExistError if the catalog or any of the schemas does not exist.
+
+        If the client was created with a `cache_ttl`, the listed tables are also cached, so
+        subsequent lookups of them do not need to go to the server.
+        """
+        tables = list_tables_bulk(
+            session=self.session, uc_url=self.uc_url, catalog=catalog, schemas=schemas
         )
+        if self._table_cache.ttl > 0:
+            for schema, schema_tables in tables.items():
+                for table in schema_tables:
+                    self._table_cache.put(
+                        (catalog, schema, table.name), table.model_copy(deep=True)
+                    )
+        return tables
+
+    def prewarm_schema(self, catalog: str, schema: str) -> None:
+        """
+        Fetches the info of all the tables in the specified catalog.schema into the cache
+        with a single listing, instead of one request per table later on.
+        Does nothing useful if the client was created without a `cache_ttl`.
+        """
+        self.list_tables(catalog=catalog, schema=schema)
 
     def update_table(self, catalog: str, schema: str, table: Table) -> Table:
         """
@@ -277,6 +554,7 @@ class UCClient:
         Returns a Table with updated information.
         Raises a DoesNotExistError if the table does not exist.
         """
+        self._table_cache.pop((catalog, schema, table.name))
         return update_table(
             session=self.session,
             uc_url=self.uc_url,
@@ -297,6 +575,7 @@ class UCClient:
         Returns a Table with updated information.
         Raises a DoesNotExistError if the table does not exist.
         """
+        self._table_cache.pop((catalog, schema, table))
         return set_table_default_merge_columns(
             session=self.session,
             uc_url=self.uc_url,
@@ -306,28 +585,103 @@ class UCClient:
             merge_columns=merge_columns,
         )
 
-    def read_table(self, catalog: str, schema: str, name: str) -> pl.DataFrame:
+    def read_table(
+        self,
+        catalog: str,
+        schema: str,
+        name: str,
+        columns: list[str] | None = None,
+        predicate: pl.Expr | None = None,
+        row_limit: int | None = None,
+    ) -> pl.DataFrame:
         """
         Reads the specified table from Unity Catalog and returns it as a Polars DataFrame.
+
+        If `columns` is specified, only those columns are read. If `predicate` is specified,
+        only the rows matching it are read. If `row_limit` is specified, at most that many
+        rows are read. These are pushed down to the file reader when possible.
+        """
+        from .dataframe import read_table
+
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        return read_table(
+            table=table, columns=columns, predicate=predicate, row_limit=row_limit
+        )
+
+    def read_table_via_duckdb(
+        self, catalog: str, schema: str, name: str
+    ) -> pl.DataFrame:
+        """
+        Reads the specified DELTA table with the DuckDB connection and returns it as a
+        Polars DataFrame. DuckDB resolves the table through its own Unity Catalog
+        attachment, so no separate Unity Catalog request is made from Python.
+
+        The catalog must be attached in the DuckDB connection; the 'unity' catalog is
+        attached by default. The same limitations as with `sql` apply, e.g. only DELTA
+        tables are supported.
         """
-        table = self.get_table(catalog=catalog, schema=schema, table=name)
-        return read_table(table=table)
+        relation = self.sql(
+            "SELECT * FROM "
+            + ".".join(_quote_identifier(part) for part in (catalog, schema, name))
+        )
+        return relation.pl()
 
-    def scan_table(self, catalog: str, schema: str, name: str) -> pl.LazyFrame:
+    def scan_table(
+        self,
+        catalog: str,
+        schema: str,
+        name: str,
+        columns: list[str] | None = None,
+        predicate: pl.Expr | None = None,
+    ) -> pl.LazyFrame:
         """
         Lazily reads/scans the specified table from Unity Catalog and returns it as a Polars LazyFrame.
+
+        If `columns` and/or `predicate` is specified, they are already applied to the returned
+        LazyFrame, so they are always pushed down to the file reader.
         """
-        table = self.get_table(catalog=catalog, schema=schema, table=name)
-        return scan_table(table=table)
+        from .dataframe import scan_table
+
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        return scan_table(table=table, columns=columns, predicate=predicate)
+
+    def iter_table(
+        self, catalog: str, schema: str, name: str, batch_size: int = 100_000
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Reads the specified table from Unity Catalog in batches of at most `batch_size` rows
+        and returns an iterator of Polars DataFrames. Useful for processing tables that do not
+        fit in memory. Note: AVRO tables are still read fully into memory before slicing.
+        """
+        from .dataframe import iter_batches
+
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        return iter_batches(table=table, batch_size=batch_size)
 
     def get_delta_table(self, catalog: str, schema: str, name: str) -> DeltaTable:
         """
         Returns the specified table from Unity Catalog as a `DeltaTable`.
 
         Raises an `UnsupportedOperationError` if the table is not DELTA.
+
+        If the client was created with a `cache_ttl`, the `DeltaTable` is kept and reused by
+        later calls for the same table: instead of loading the Delta log from scratch, only
+        the versions committed since are applied to it. The returned `DeltaTable` is then
+        shared between the calls.
         """
-        table = self.get_table(catalog=catalog, schema=schema, table=name)
-        return get_delta_table(table=table)
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        key = (catalog, schema, name)
+        cached = self._delta_table_cache.get(key)
+        if cached is not None and cached[0] == table.storage_location:
+            dt = cached[1]
+            try:
+                dt.update_incremental()
+                return dt
+            except Exception:
+                self._delta_table_cache.pop(key)
+        dt = get_delta_table(table=table)
+        self._delta_table_cache.put(key, (table.storage_location, dt))
+        return dt
 
     def sync_delta_properties(self, catalog: str, schema: str, name: str) -> Table:
         """
@@ -339,18 +693,47 @@ class UCClient:
         get the table as a `DeltaTable` with `get_delta_table`, use the
         `DeltaTable` to make your changes, and finally sync with Unity Catalog
         with this method.
-        """
-        return sync_delta_properties(
+
+        If the client was created with a `cache_ttl` and the Delta table has not gotten
+        any new versions since the last sync through this client, the sync is skipped.
+        """
+        key = (catalog, schema, name)
+        if self._delta_sync_cache.ttl <= 0:
+            self._table_cache.pop(key)
+            return sync_delta_properties(
+                session=self.session,
+                uc_url=self.uc_url,
+                catalog=catalog,
+                schema=schema,
+                name=name,
+            )
+
+        dt = self.get_delta_table(catalog=catalog, schema=schema, name=name)
+        version = dt.version()
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        synced = self._delta_sync_cache.get(key)
+        # If the cached Table is no longer the one the last sync stored, it has been
+        # invalidated or refetched since, and UC may no longer have the synced properties.
+        if synced is not None and synced[0] == version and synced[1] is table:
+            return table.model_copy(deep=True)
+
+        self._table_cache.pop(key)
+        table = sync_delta_properties(
             session=self.session,
             uc_url=self.uc_url,
             catalog=catalog,
             schema=schema,
             name=name,
+            table=table,
+            dt=dt,
         )
+        self._table_cache.put(key, table)
+        self._delta_sync_cache.put(key, (version, table))
+        return table.model_copy(deep=True)
 
     def write_table(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | pl.LazyFrame,
         catalog: str,
         schema: str,
         name: str,
@@ -362,8 +745,10 @@ class UCClient:
         replace_where: str | None = None,
     ) -> None:
         """
-        Writes the Polars DataFrame `df` to the Unity Catalog table
+        Writes the Polars DataFrame or LazyFrame `df` to the Unity Catalog table
         `catalog.schema.name`. If the table does not already exist, it is created.
+        LazyFrames are streamed to single file Parquet and CSV tables; for other formats
+        they are collected with the streaming engine first.
 
         `mode` specifies the writing mode:
             - WriteMode.APPEND to append to the existing table, IF it exists.
@@ -382,7 +767,32 @@ class UCClient:
             schema_evolution = literal_to_schemaevolution(schema_evolution)
         if not isinstance(mode, WriteMode):
             mode = literal_to_writemode(mode)
-        table = self.get_table(catalog=catalog, schema=schema, table=name)
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
+        self._write_table(
+            table=table,
+            df=df,
+            mode=mode,
+            schema_evolution=schema_evolution,
+            partition_filters=partition_filters,
+            replace_where=replace_where,
+        )
+
+    def _write_table(
+        self,
+        table: Table,
+        df: pl.DataFrame | pl.LazyFrame,
+        mode: WriteMode,
+        schema_evolution: SchemaEvolution,
+        partition_filters: list[tuple[str, str, Any]] | None = None,
+        replace_where: str | None = None,
+    ) -> None:
+        """
+        Writes `df` to the already fetched `table` and updates its columns in Unity Catalog
+        if the schema changed. Lets callers that already hold the Table skip fetching it again.
+        """
+        from .dataframe import write_table
+
+        catalog, schema, name = table.catalog_name, table.schema_name, table.name
         new_columns = write_table(
             table=table,
             df=df,
@@ -392,11 +802,16 @@ class UCClient:
             replace_where=replace_where,
         )
         if new_columns is not None:
-            try:
-                table.columns = new_columns
-                overwrite_table(session=self.session, uc_url=self.uc_url, table=table)
-            except Exception as e:
-                raise Exception("Something went horribly wrong.") from e
+            # The table we just fetched is passed as the original so overwrite_table
+            # does not need to fetch it again, and can restore it if the update fails.
+            self._table_cache.pop((catalog, schema, name))
+            new_table = overwrite_table(
+                session=self.session,
+                uc_url=self.uc_url,
+                table=table.model_copy(update={"columns": new_columns}),
+                original_table=table,
+            )
+            self._table_cache.put((catalog, schema, name), new_table)
 
     def merge_table(
         self,
@@ -417,7 +832,9 @@ class UCClient:
 
         This method only supports exactly matching schemas.
         """
-        table = self.get_table(catalog=catalog, schema=schema, table=name)
+        from .dataframe import merge_table
+
+        table = self._get_table(catalog=catalog, schema=schema, table=name)
         return merge_table(
             table=table,
             df=df,
@@ -428,7 +845,7 @@ class UCClient:
 
     def create_as_table(
         self,
-        df: pl.DataFrame,
+        df: pl.DataFrame | pl.LazyFrame,
         catalog: str,
         schema: str,
         name: str,
@@ -440,9 +857,11 @@ class UCClient:
         partition_cols: list[str] | None = None,
     ) -> Table:
         """
-        Creates a new table to Unity Catalog with the schema of the Polars DataFrame `df`
+        Creates a new table to Unity Catalog with the schema of the Polars DataFrame/LazyFrame `df`
         and writes `df` to the new table. Raises an AlreadyExistsError if the table alredy exists.
         """
+        from .dataframe import df_schema_to_uc_schema
+
         if not isinstance(file_type, FileType):
             file_type = literal_to_filetype(file_type)
         if not isinstance(table_type, TableType):
@@ -460,17 +879,12 @@ class UCClient:
             raise UnsupportedOperationError(
                 "Only local storage is supported. Hint: location must be of the form file://<absolute_path>, e.g. file:///home/me/ex-delta-table"
             )
-        cols = df_schema_to_uc_schema(df=df)
         if partition_cols is not None:
             if file_type not in (FileType.DELTA, FileType.PARQUET):
                 raise UnsupportedOperationError(
                     "Partitioned tables only supported for DELTA and PARQUET."
                 )
-            for i, col in enumerate(cols):
-                if col.name not in partition_cols:
-                    continue
-                partition_ind = partition_cols.index(col.name)
-                cols[i].partition_index = partition_ind
+        cols = df_schema_to_uc_schema(df=df, partition_cols=partition_cols or [])
         table = Table(
             name=name,
             catalog_name=catalog,
@@ -481,8 +895,11 @@ class UCClient:
             storage_location=location,
         )
         table = self.create_table(table=table)
-        self.write_table(
-            df=df, catalog=catalog, schema=schema, name=name, mode=WriteMode.OVERWRITE
+        self._write_table(
+            table=table,
+            df=df,
+            mode=WriteMode.OVERWRITE,
+            schema_evolution=SchemaEvolution.STRICT,
         )
         return table
 
@@ -501,6 +918,8 @@ class UCClient:
         Creates a new table to Unity Catalog from a table/file at `filepath`.
         Raises an AlreadyExistsError if the table alredy exists.
         """
+        from .dataframe import read_table, scan_table, df_schema_to_uc_schema
+
         if not isinstance(file_type, FileType):
             file_type = literal_to_filetype(file_type)
         if not filepath.startswith("file://"):
@@ -518,27 +937,35 @@ class UCClient:
             columns=[],
             storage_location=filepath,
         )
-        df = read_table(table=table)
-        cols = df_schema_to_uc_schema(df=df)
+        # Only the schema is needed, so scan instead of reading the whole table;
+        # Avro cannot be scanned, so it still has to be read.
+        df: pl.DataFrame | pl.LazyFrame
+        if file_type == FileType.AVRO:
+            df = read_table(table=table)
+        else:
+            df = scan_table(table=table)
         if partition_cols is not None:
             if file_type not in (FileType.DELTA, FileType.PARQUET):
                 raise UnsupportedOperationError(
                     "Partitioned tables only supported for DELTA and PARQUET."
                 )
-            for i, col in enumerate(cols):
-                if col.name not in partition_cols:
-                    continue
-                partition_ind = partition_cols.index(col.name)
-                cols[i].partition_index = partition_ind
+        cols = df_schema_to_uc_schema(df=df, partition_cols=partition_cols or [])
         table.columns = cols
         table = self.create_table(table=table)
         return table
 
-    def sql(self, query: str) -> duckdb.DuckDBPyRelation:
+    def sql(
+        self, query: str, params: list[Any] | dict[str, Any] | None = None
+    ) -> duckdb.DuckDBPyRelation:
         """
         Passes the `query` to the DuckDB connection.
         NOTE: at the moment the connection is read only and only supports Delta Tables.
+
+        Values can be bound to the query with `params`: a list for `?` placeholders or a dict
+        for `$name` placeholders. DuckDB then prepares the query once and binds the values,
+        instead of the values being formatted into the query string.
         """
-        if self.conn is None:
+        conn = self.conn
+        if conn is None:
             raise DuckDBConnectionSetupError
-        return self.conn.sql(query=query)
+        return conn.sql(query=query, params=params)
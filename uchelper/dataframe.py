@@ -1,88 +1,96 @@
 import polars as pl
 import os
-import time
 import uuid
-from enum import Enum
-from typing import Literal, cast, Any
+from collections.abc import Iterator
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, Literal, cast, Any
+import pyarrow.dataset as ds  # type: ignore[import-untyped]
+from deltalake import DeltaTable
 from deltalake.table import TableMerger
 from .exceptions import UnsupportedOperationError, SchemaMismatchError
-from .models import Table, FileType, Column, DataType
-
-
-class WriteMode(str, Enum):
-    APPEND = "APPEND"
-    OVERWRITE = "OVERWRITE"
-
-
-class SchemaEvolution(str, Enum):
-    STRICT = "STRICT"
-    MERGE = "MERGE"
-    OVERWRITE = "OVERWRITE"
+from .models import (
+    Table,
+    FileType,
+    Column,
+    DataType,
+    WriteMode,
+    SchemaEvolution,
+    get_partition_columns,
+)
+
+# Polars dtypes that map to a Unity Catalog type without precision/scale, keyed by the
+# dtype class so that lookups are a single dict access. The values are the full return
+# values of polars_type_to_uc_type, built once at import. pl.Utf8 is an alias of pl.String.
+_POLARS_TO_UC_TYPE: dict[type[pl.DataType], tuple[DataType, int, int]] = {
+    pl.Float32: (DataType.FLOAT, 0, 0),
+    pl.Float64: (DataType.DOUBLE, 0, 0),
+    pl.Int8: (DataType.BYTE, 0, 0),
+    pl.Int16: (DataType.SHORT, 0, 0),
+    pl.Int32: (DataType.INT, 0, 0),
+    pl.Int64: (DataType.LONG, 0, 0),
+    pl.Date: (DataType.DATE, 0, 0),
+    pl.Datetime: (DataType.TIMESTAMP, 0, 0),
+    pl.Array: (DataType.ARRAY, 0, 0),
+    pl.List: (DataType.ARRAY, 0, 0),
+    pl.Struct: (DataType.STRUCT, 0, 0),
+    pl.String: (DataType.STRING, 0, 0),
+    pl.Binary: (DataType.BINARY, 0, 0),
+    pl.Boolean: (DataType.BOOLEAN, 0, 0),
+    pl.Null: (DataType.NULL, 0, 0),
+}
 
 
 def polars_type_to_uc_type(t: pl.DataType) -> tuple[DataType, int, int]:
     """
-    Converts the enum DataType to a polars.DataType
-    """
-    match t:
-        case pl.Decimal:
-            return (
-                DataType.DECIMAL,
-                # Polars allows precision to be None, we just use 0 as default.
-                # How did mypy not notice that precision could be None?
-                # TODO: figure out what to actually do in this case.
-                t.precision if t.precision is not None else 0,
-                t.scale,
-            )
-        case pl.Float32:
-            return (DataType.FLOAT, 0, 0)
-        case pl.Float64:
-            return (DataType.DOUBLE, 0, 0)
-        case pl.Int8:
-            return (DataType.BYTE, 0, 0)
-        case pl.Int16:
-            return (DataType.SHORT, 0, 0)
-        case pl.Int32:
-            return (DataType.INT, 0, 0)
-        case pl.Int64:
-            return (DataType.LONG, 0, 0)
-        case pl.Date:
-            return (DataType.DATE, 0, 0)
-        case pl.Datetime:
-            return (DataType.TIMESTAMP, 0, 0)
-        case pl.Array:
-            return (DataType.ARRAY, 0, 0)
-        case pl.List:
-            return (DataType.ARRAY, 0, 0)
-        case pl.Struct:
-            return (DataType.STRUCT, 0, 0)
-        case pl.String | pl.Utf8:
-            return (DataType.STRING, 0, 0)
-        case pl.Binary:
-            return (DataType.BINARY, 0, 0)
-        case pl.Boolean:
-            return (DataType.BOOLEAN, 0, 0)
-        case pl.Null:
-            return (DataType.NULL, 0, 0)
-        case _:
-            raise UnsupportedOperationError(f"Unsupported datatype: {t}")
-    # Why did mypy start complaining about missing return here after bumping Polars to 1.3.0?
-    return (DataType.NULL, 0, 0)
+    Converts a polars.DataType to the enum DataType
+    """
+    # Both dtype instances and bare dtype classes (e.g. pl.Int64) are accepted.
+    dtype_class = cast(type[pl.DataType], t) if isinstance(t, type) else type(t)
+    res = _POLARS_TO_UC_TYPE.get(dtype_class)
+    if res is not None:
+        return res
+    if isinstance(t, pl.Decimal):
+        return (
+            DataType.DECIMAL,
+            # Polars allows precision to be None, we just use 0 as default.
+            # TODO: figure out what to actually do in this case.
+            t.precision if t.precision is not None else 0,
+            t.scale,
+        )
+    raise UnsupportedOperationError(f"Unsupported datatype: {t}")
 
 
 def df_schema_to_uc_schema(
-    df: pl.DataFrame | pl.LazyFrame, partition_cols: list[str] = []
+    df: pl.DataFrame | pl.LazyFrame,
+    partition_cols: list[str] = [],
+    schema: pl.Schema | None = None,
 ) -> list[Column]:
-    res = []
-    if isinstance(df, pl.DataFrame):
-        schema = df.schema
-    elif isinstance(df, pl.LazyFrame):
+    """
+    Converts the schema of `df` to a list of Unity Catalog Columns. If the caller has
+    already resolved the schema of `df`, it can be passed as `schema` so that a LazyFrame
+    does not need to resolve it again.
+    """
+    if schema is None:
+        # collect_schema works for both DataFrames and LazyFrames and does not go
+        # through the deprecated LazyFrame.schema property.
         schema = df.collect_schema()
-    for i, (col_name, col_type) in enumerate(schema.items()):
+    cols = _schema_to_uc_columns(
+        schema=tuple(schema.items()), partition_cols=tuple(partition_cols)
+    )
+    # The cached Columns are shared, so hand out copies that callers are free to modify.
+    return [col.model_copy() for col in cols]
+
+
+@lru_cache(maxsize=128)
+def _schema_to_uc_columns(
+    schema: tuple[tuple[str, pl.DataType], ...], partition_cols: tuple[str, ...]
+) -> tuple[Column, ...]:
+    partition_indices = {col_name: i for i, col_name in enumerate(partition_cols)}
+    res = []
+    for i, (col_name, col_type) in enumerate(schema):
         t = polars_type_to_uc_type(col_type)
-        partition_ind = None
-        if col_name in partition_cols:
-            partition_ind = partition_cols.index(col_name)
+        partition_ind = partition_indices.get(col_name)
         res.append(
             Column(
                 name=col_name,
@@ -94,89 +102,143 @@ def df_schema_to_uc_schema(
                 partition_index=partition_ind,
             )
         )
-    return res
+    return tuple(res)
+
+
+# Reverse of _POLARS_TO_UC_TYPE for the Unity Catalog types that Polars supports.
+# DECIMAL is handled separately since it needs precision and scale.
+_UC_TO_POLARS_TYPE: dict[DataType, pl.DataType] = {
+    DataType.BOOLEAN: cast(pl.DataType, pl.Boolean),
+    DataType.BYTE: cast(pl.DataType, pl.Int8),
+    DataType.SHORT: cast(pl.DataType, pl.Int16),
+    DataType.INT: cast(pl.DataType, pl.Int32),
+    DataType.LONG: cast(pl.DataType, pl.Int64),
+    DataType.FLOAT: cast(pl.DataType, pl.Float32),
+    DataType.DOUBLE: cast(pl.DataType, pl.Float64),
+    DataType.DATE: cast(pl.DataType, pl.Date),
+    DataType.TIMESTAMP: cast(pl.DataType, pl.Datetime),
+    DataType.STRING: cast(pl.DataType, pl.String),
+    DataType.BINARY: cast(pl.DataType, pl.Binary),
+    DataType.ARRAY: cast(pl.DataType, pl.Array),
+    DataType.STRUCT: cast(pl.DataType, pl.Struct),
+    DataType.CHAR: cast(pl.DataType, pl.String),
+    DataType.NULL: cast(pl.DataType, pl.Null),
+}
 
 
 def uc_type_to_polars_type(
     t: DataType, precision: int = 0, scale: int = 0
 ) -> pl.DataType:
-    match t:
-        case DataType.BOOLEAN:
-            return cast(pl.DataType, pl.Boolean)
-        case DataType.BYTE:
-            return cast(pl.DataType, pl.Int8)
-        case DataType.SHORT:
-            return cast(pl.DataType, pl.Int16)
-        case DataType.INT:
-            return cast(pl.DataType, pl.Int32)
-        case DataType.LONG:
-            return cast(pl.DataType, pl.Int64)
-        case DataType.FLOAT:
-            return cast(pl.DataType, pl.Float32)
-        case DataType.DOUBLE:
-            return cast(pl.DataType, pl.Float64)
-        case DataType.DATE:
-            return cast(pl.DataType, pl.Date)
-        case DataType.TIMESTAMP:
-            return cast(pl.DataType, pl.Datetime)
-        case DataType.STRING:
-            return cast(pl.DataType, pl.String)
-        case DataType.BINARY:
-            return cast(pl.DataType, pl.Binary)
-        case DataType.DECIMAL:
-            return cast(pl.DataType, pl.Decimal(precision=precision, scale=scale))
-        case DataType.ARRAY:
-            return cast(pl.DataType, pl.Array)
-        case DataType.STRUCT:
-            return cast(pl.DataType, pl.Struct)
-        case DataType.CHAR:
-            return cast(pl.DataType, pl.String)
-        case DataType.NULL:
-            return cast(pl.DataType, pl.Null)
-        case _:
-            raise UnsupportedOperationError(f"Unsupported datatype: {t.value}")
+    pl_type = _UC_TO_POLARS_TYPE.get(t)
+    if pl_type is not None:
+        return pl_type
+    if t == DataType.DECIMAL:
+        return cast(pl.DataType, pl.Decimal(precision=precision, scale=scale))
+    raise UnsupportedOperationError(f"Unsupported datatype: {t.value}")
 
 
 def uc_schema_to_df_schema(cols: list[Column]) -> dict[str, pl.DataType]:
     return {col.name: uc_type_to_polars_type(col.data_type) for col in cols}
 
 
+def _by_position(cols: list[Column]) -> list[Column]:
+    """
+    Returns `cols` ordered by position. Positions are normally 0..n-1, in which case each
+    Column is placed directly at its index instead of sorting.
+    """
+    res: list[Column | None] = [None] * len(cols)
+    for col in cols:
+        pos = col.position
+        if not 0 <= pos < len(res) or res[pos] is not None:
+            return sorted(cols, key=attrgetter("position"))
+        res[pos] = col
+    return cast(list[Column], res)
+
+
+def _comparable_column(col: Column) -> tuple:
+    # Precision and scale only matter for DECIMAL columns. Enum members are singletons,
+    # so they are compared by identity.
+    if col.data_type is DataType.DECIMAL:
+        return (col.name, col.data_type, col.type_precision, col.type_scale)
+    return (col.name, col.data_type)
+
+
+def _comparable_columns(cols: list[Column]) -> list[tuple]:
+    """
+    Returns the fields of `cols` that check_schema_equality compares, ordered by position.
+    """
+    return [_comparable_column(col) for col in _by_position(cols)]
+
+
 def check_schema_equality(left: list[Column], right: list[Column]) -> bool:
     if len(left) != len(right):
         return False
-    left = sorted(left, key=lambda x: x.position)
-    right = sorted(right, key=lambda x: x.position)
-    for left_col, right_col in zip(left, right):
-        if left_col.name != right_col.name:
-            return False
-        if left_col.data_type != right_col.data_type:
+    return _comparable_columns(left) == _comparable_columns(right)
+
+
+# Fingerprints of (DataFrame schema, Unity Catalog schema) pairs that are already known to
+# match, so that repeatedly writing the same schema to a table skips the conversion and
+# comparison. Cleared when it grows past _MATCHING_SCHEMAS_MAX_SIZE.
+_MATCHING_SCHEMAS: set[tuple[tuple, tuple]] = set()
+_MATCHING_SCHEMAS_MAX_SIZE = 128
+
+
+def _uc_schema_fingerprint(cols: list[Column]) -> tuple:
+    # Only the fields compared in check_schema_equality matter here.
+    return tuple(
+        sorted(
+            (col.position, col.name, col.data_type, col.type_precision, col.type_scale)
+            for col in cols
+        )
+    )
+
+
+def _df_schema_matches(df_schema: pl.Schema, uc: list[Column]) -> bool:
+    """
+    Same as `check_schema_equality(df_schema_to_uc_schema(df), uc)`, but compares the
+    Polars types directly against `uc` without building Column objects for `df`.
+    """
+    if len(df_schema) != len(uc):
+        return False
+    for (name, dtype), col in zip(df_schema.items(), _by_position(uc)):
+        data_type, precision, scale = polars_type_to_uc_type(dtype)
+        if name != col.name or data_type != col.data_type:
             return False
-        if left_col.data_type == DataType.DECIMAL and (
-            left_col.type_precision != right_col.type_precision
-            or left_col.type_scale != right_col.type_scale
+        if data_type == DataType.DECIMAL and (
+            precision != col.type_precision or scale != col.type_scale
         ):
             return False
     return True
 
 
+def _schemas_match(df_schema: pl.Schema, uc: list[Column]) -> bool:
+    """
+    Returns whether `df_schema` matches the Unity Catalog schema `uc`. Matching pairs are
+    remembered in _MATCHING_SCHEMAS.
+    """
+    fingerprint = (tuple(df_schema.items()), _uc_schema_fingerprint(uc))
+    if fingerprint in _MATCHING_SCHEMAS:
+        return True
+    if not _df_schema_matches(df_schema=df_schema, uc=uc):
+        return False
+    if len(_MATCHING_SCHEMAS) >= _MATCHING_SCHEMAS_MAX_SIZE:
+        _MATCHING_SCHEMAS.clear()
+    _MATCHING_SCHEMAS.add(fingerprint)
+    return True
+
+
 def raise_for_schema_mismatch(
     df: pl.DataFrame | pl.LazyFrame, uc: list[Column]
 ) -> None:
-    df_uc_schema = df_schema_to_uc_schema(df=df)
-    if not check_schema_equality(left=df_uc_schema, right=uc):
+    df_schema = df.collect_schema()
+    if not _schemas_match(df_schema=df_schema, uc=uc):
+        # The Columns are only needed for the error message
+        df_uc_schema = df_schema_to_uc_schema(df=df, schema=df_schema)
         raise SchemaMismatchError(
             f"Schema evolution is set to strict but schemas do not match: {df_uc_schema} VS {uc}"
         )
 
 
-def get_partition_columns(cols: list[Column]) -> list[Column]:
-    partition_cols = [col for col in cols if col.partition_index is not None]
-    # mypy doesn't understand that the type of x.partition_index is int in the following lambda
-    # and instead thinks it's int | None and complains if we don't just ignore it.
-    # TODO: find a better workaroudn than just ignoring?
-    return sorted(partition_cols, key=lambda x: x.partition_index)  # type: ignore
-
-
 def get_default_merge_condition(
     table: Table, source_alias: str, target_alias: str
 ) -> str:
@@ -188,261 +250,619 @@ def get_default_merge_condition(
     )
 
 
-def read_table(table: Table) -> pl.DataFrame:
-    path = table.storage_location
-    assert path is not None
-    if not path.startswith("file://"):
-        raise UnsupportedOperationError("Only local storage is supported.")
-    path = path.removeprefix("file://")
-    match table.file_type:
-        case FileType.DELTA:
-            df = pl.read_delta(source=path)
+def _read_delta(table: Table, path: str) -> pl.DataFrame:
+    # Read through the PyArrow dataset so that Parquet decoding runs on PyArrow's
+    # thread pool, and skip rechunking the result.
+    dataset = DeltaTable(table_uri=path).to_pyarrow_dataset()
+    return cast(
+        pl.DataFrame, pl.from_arrow(dataset.to_table(use_threads=True), rechunk=False)
+    )
 
-        case FileType.PARQUET:
-            partition_cols = get_partition_columns(table.columns)
-            if len(partition_cols) == 0:
-                df = pl.read_parquet(source=path)
-            else:
-                df = pl.read_parquet(
-                    source=path,
-                    hive_partitioning=True,
-                    hive_schema={
-                        col.name: uc_type_to_polars_type(col.data_type)
-                        for col in partition_cols
-                    },
-                )
 
-        case FileType.CSV:
-            pl_schema = uc_schema_to_df_schema(table.columns)
-            if len(pl_schema) == 0:
-                df = pl.read_csv(source=path)
-            else:
-                df = pl.read_csv(source=path, schema=pl_schema)
+def _polars_reads_hive_root(path: str) -> bool:
+    """
+    Whether Polars can read the hive partitioned table directory `path` itself.
 
-        case FileType.AVRO:
-            df = pl.read_avro(source=path)
+    Polars parses partition values from the full paths of the files once a query is
+    optimized, so a table directory with "=" in its path (e.g. /data/env=prod/tbl) is read
+    through a PyArrow dataset instead, which parses them relative to the table directory.
+    """
+    return "=" not in path
 
-        case _:
+
+def _parquet_files(path: str) -> list[str]:
+    """
+    Lists the Parquet files under the table directory `path`, skipping other files such
+    as _SUCCESS markers.
+    """
+    return [
+        os.path.join(root, filename)
+        for root, _, filenames in os.walk(path)
+        for filename in filenames
+        if filename.endswith(".parquet")
+    ]
+
+
+def _parquet_dataset(table: Table) -> ds.Dataset | None:
+    """
+    Returns the Parquet files of `table` as a PyArrow dataset, with the partition columns
+    parsed from the paths relative to the table directory. Returns None if a partitioned
+    table has no Parquet files.
+    """
+    path = table.local_path
+    if len(table.partition_column_names) == 0:
+        return ds.dataset(source=path, format="parquet")
+    files = _parquet_files(path=path)
+    if len(files) == 0:
+        return None
+    hive_schema = pl.DataFrame(schema=table.hive_schema).to_arrow().schema
+    return ds.dataset(
+        source=files,
+        format="parquet",
+        partitioning=ds.partitioning(schema=hive_schema, flavor="hive"),
+        partition_base_dir=path,
+    )
+
+
+def _read_parquet(table: Table, path: str) -> pl.DataFrame:
+    partition_cols = table.partition_column_names
+    if len(partition_cols) == 0:
+        return pl.read_parquet(source=path)
+    if _polars_reads_hive_root(path=path):
+        try:
+            return pl.read_parquet(
+                source=path, hive_partitioning=True, hive_schema=table.hive_schema
+            )
+        except pl.exceptions.InvalidOperationError:
+            # The directory also contains files that are not Parquet (e.g. notes.txt)
+            pass
+    dataset = _parquet_dataset(table=table)
+    if dataset is None:
+        # No Parquet files; let Polars report the error.
+        return pl.read_parquet(
+            source=path, hive_partitioning=True, hive_schema=table.hive_schema
+        )
+    return cast(
+        pl.DataFrame,
+        pl.from_arrow(dataset.to_table(use_threads=True), rechunk=False),
+    )
+
+
+def _scan_parquet(table: Table, path: str) -> pl.LazyFrame:
+    partition_cols = table.partition_column_names
+    if len(partition_cols) == 0:
+        return pl.scan_parquet(source=path)
+    lf = pl.scan_parquet(
+        source=path, hive_partitioning=True, hive_schema=table.hive_schema
+    )
+    if _polars_reads_hive_root(path=path):
+        try:
+            # Polars only lists the directory when the plan is resolved, so resolve the
+            # schema here to find out if the directory contains files that are not Parquet.
+            lf.collect_schema()
+            return lf
+        except pl.exceptions.InvalidOperationError:
+            pass
+    dataset = _parquet_dataset(table=table)
+    if dataset is None:
+        return lf
+    return pl.scan_pyarrow_dataset(dataset)
+
+
+def _scan_csv(table: Table, path: str) -> pl.LazyFrame:
+    pl_schema = uc_schema_to_df_schema(table.columns)
+    if len(pl_schema) == 0:
+        return pl.scan_csv(source=path)
+    return pl.scan_csv(source=path, schema=pl_schema)
+
+
+def _read_csv(table: Table, path: str) -> pl.DataFrame:
+    # Collect with the streaming engine so that the CSV is parsed in batches.
+    return _scan_csv(table=table, path=path).collect(streaming=True)
+
+
+def _read_avro(table: Table, path: str) -> pl.DataFrame:
+    return pl.read_avro(source=path)
+
+
+# Reader for each supported file type; looked up once per read_table call.
+_READERS: dict[FileType, Callable[[Table, str], pl.DataFrame]] = {
+    FileType.DELTA: _read_delta,
+    FileType.PARQUET: _read_parquet,
+    FileType.CSV: _read_csv,
+    FileType.AVRO: _read_avro,
+}
+
+
+def _scan_delta(table: Table, path: str) -> pl.LazyFrame:
+    return pl.scan_delta(source=path)
+
+
+def _scan_avro(table: Table, path: str) -> pl.LazyFrame:
+    raise UnsupportedOperationError("scan is not supported for Avro.")
+
+
+# Scanner for each supported file type; looked up once per scan_table call.
+_SCANNERS: dict[FileType, Callable[[Table, str], pl.LazyFrame]] = {
+    FileType.DELTA: _scan_delta,
+    FileType.PARQUET: _scan_parquet,
+    FileType.CSV: _scan_csv,
+    FileType.AVRO: _scan_avro,
+}
+
+
+def read_table(
+    table: Table,
+    columns: list[str] | None = None,
+    predicate: pl.Expr | None = None,
+    row_limit: int | None = None,
+) -> pl.DataFrame:
+    """
+    Reads `table` into a Polars DataFrame.
+
+    If `columns`, `predicate`, or `row_limit` is set, the table is scanned lazily and only
+    the selected columns/first `row_limit` matching rows are collected, so Polars can push
+    the projection, filter, and limit down to the reader. Avro does not support scanning,
+    so it is read fully and then filtered.
+    """
+    if columns is None and predicate is None and row_limit is None:
+        path = table.local_path
+        reader = _READERS.get(table.file_type)
+        if reader is None:
             raise NotImplementedError
+        return reader(table, path)
+
+    if table.file_type == FileType.AVRO:
+        lf = read_table(table=table).lazy()
+        if predicate is not None:
+            lf = lf.filter(predicate)
+        if columns is not None:
+            lf = lf.select(columns)
+    else:
+        lf = scan_table(table=table, columns=columns, predicate=predicate)
+    if row_limit is not None:
+        lf = lf.limit(row_limit)
+    return lf.collect()
+
+
+def scan_table(
+    table: Table,
+    columns: list[str] | None = None,
+    predicate: pl.Expr | None = None,
+) -> pl.LazyFrame:
+    """
+    Lazily scans `table` into a Polars LazyFrame.
 
+    If `columns` and/or `predicate` is given, they are applied to the scan before it is
+    returned, so they are always pushed down to the reader.
+    """
+    path = table.local_path
+    scanner = _SCANNERS.get(table.file_type)
+    if scanner is None:
+        raise NotImplementedError
+    df = scanner(table, path)
+
+    if predicate is not None:
+        df = df.filter(predicate)
+    if columns is not None:
+        df = df.select(columns)
     return df
 
 
-def scan_table(table: Table) -> pl.LazyFrame:
-    path = table.storage_location
-    assert path is not None
-    if not path.startswith("file://"):
-        raise UnsupportedOperationError("Only local storage is supported.")
-    path = path.removeprefix("file://")
+def _iter_arrow_batches(
+    dataset: ds.Dataset, batch_size: int
+) -> Iterator[pl.DataFrame]:
+    for batch in dataset.to_batches(batch_size=batch_size):
+        if batch.num_rows > 0:
+            yield cast(pl.DataFrame, pl.from_arrow(batch))
+
+
+def _iter_csv(table: Table, batch_size: int) -> Iterator[pl.DataFrame]:
+    pl_schema = uc_schema_to_df_schema(table.columns)
+    reader = pl.read_csv_batched(
+        source=table.local_path,
+        schema_overrides=pl_schema if len(pl_schema) > 0 else None,
+        batch_size=batch_size,
+    )
+    # The batch size of the reader is only a hint, so the batches are sliced to at most
+    # batch_size rows.
+    while (batches := reader.next_batches(1)) is not None:
+        for batch in batches:
+            yield from batch.iter_slices(n_rows=batch_size)
+
+
+def iter_batches(table: Table, batch_size: int = 100_000) -> Iterator[pl.DataFrame]:
+    """
+    Reads `table` in batches of at most `batch_size` rows and yields each batch as a
+    Polars DataFrame.
+
+    DELTA and PARQUET tables are read in batches from the underlying Parquet files with
+    PyArrow, and CSV tables with Polars' batched CSV reader, so the full table is never
+    materialized in memory. AVRO tables are read fully into memory and then sliced.
+    """
     match table.file_type:
         case FileType.DELTA:
-            df = pl.scan_delta(source=path)
+            dataset = DeltaTable(table_uri=table.local_path).to_pyarrow_dataset()
+            yield from _iter_arrow_batches(dataset=dataset, batch_size=batch_size)
 
         case FileType.PARQUET:
-            partition_cols = get_partition_columns(table.columns)
-            if len(partition_cols) == 0:
-                df = pl.scan_parquet(source=path)
-            else:
-                df = pl.scan_parquet(
-                    source=path,
-                    hive_partitioning=True,
-                    hive_schema={
-                        col.name: uc_type_to_polars_type(col.data_type)
-                        for col in partition_cols
-                    },
+            parquet_dataset = _parquet_dataset(table=table)
+            if parquet_dataset is not None:
+                yield from _iter_arrow_batches(
+                    dataset=parquet_dataset, batch_size=batch_size
                 )
 
         case FileType.CSV:
-            pl_schema = uc_schema_to_df_schema(table.columns)
-            if len(pl_schema) == 0:
-                df = pl.scan_csv(source=path)
-            else:
-                df = pl.scan_csv(source=path, schema=pl_schema)
+            yield from _iter_csv(table=table, batch_size=batch_size)
 
         case FileType.AVRO:
-            raise UnsupportedOperationError("scan is not supported for Avro.")
+            yield from read_table(table=table).iter_slices(n_rows=batch_size)
 
         case _:
             raise NotImplementedError
 
+
+_WriteHandler = Callable[
+    [
+        Table,
+        pl.DataFrame | pl.LazyFrame,
+        str,
+        WriteMode,
+        SchemaEvolution,
+        list[tuple[str, str, Any]] | None,
+        str | None,
+    ],
+    list[Column] | None,
+]
+
+
+def _collect(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    """
+    Collects `df` with the streaming engine if it is a LazyFrame.
+    """
+    if isinstance(df, pl.LazyFrame):
+        return df.collect(streaming=True)
     return df
 
 
-def write_table(
+def _sink_to_file(
+    path: str, sink: Callable[[str], None], write: Callable[[str], None]
+) -> None:
+    """
+    Streams a LazyFrame to the file `path` with `sink`, e.g. `LazyFrame.sink_parquet`.
+    If the streaming engine does not support the query plan (e.g. a scan of a Delta
+    table), the LazyFrame is instead collected and written with `write`.
+    The data is first written to a temporary file which then replaces `path`, since the
+    LazyFrame may itself be reading from `path`.
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        try:
+            sink(tmp_path)
+        except pl.exceptions.InvalidOperationError:
+            write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _schema_update(
+    df: pl.DataFrame | pl.LazyFrame,
     table: Table,
-    df: pl.DataFrame,
+    schema_evolution: SchemaEvolution,
+    partition_cols: list[str],
+) -> list[Column] | None:
+    """
+    Compares the schema of `df` to the schema of `table` once, before writing.
+
+    Returns the schema of `df` as a list[Column] if it differs from the schema of `table`,
+    otherwise None. Raises SchemaMismatchError if the schemas differ and
+    `schema_evolution` is STRICT.
+    """
+    if schema_evolution == SchemaEvolution.STRICT:
+        raise_for_schema_mismatch(df=df, uc=table.columns)
+        return None
+    df_schema = df.collect_schema()
+    if _schemas_match(df_schema=df_schema, uc=table.columns):
+        return None
+    return df_schema_to_uc_schema(
+        df=df, partition_cols=partition_cols, schema=df_schema
+    )
+
+
+# Delta write mode for each WriteMode, so that the mode is not lowercased on every write.
+_DELTA_WRITE_MODES: dict[WriteMode, Literal["append", "overwrite"]] = {
+    WriteMode.APPEND: "append",
+    WriteMode.OVERWRITE: "overwrite",
+}
+
+
+def _write_delta(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    path: str,
     mode: WriteMode,
     schema_evolution: SchemaEvolution,
-    partition_filters: list[tuple[str, str, Any]] | None = None,
-    replace_where: str | None = None,
+    partition_filters: list[tuple[str, str, Any]] | None,
+    replace_where: str | None,
 ) -> list[Column] | None:
+    partition_cols = table.partition_column_names
+    # With MERGE the resulting schema is only known after the write.
+    schema_update = (
+        None
+        if schema_evolution == SchemaEvolution.MERGE
+        else _schema_update(
+            df=df,
+            table=table,
+            schema_evolution=schema_evolution,
+            partition_cols=partition_cols,
+        )
+    )
+
+    delta_write_options: dict[str, Any] = {
+        "engine": "rust",
+    }
+
+    if schema_evolution == SchemaEvolution.OVERWRITE:
+        delta_write_options["schema_mode"] = "overwrite"
+    elif schema_evolution == SchemaEvolution.MERGE:
+        delta_write_options["schema_mode"] = "merge"
+
+    if len(partition_cols) > 0:
+        delta_write_options["partition_by"] = partition_cols
+
+    if (
+        mode == WriteMode.OVERWRITE
+        and partition_filters is not None
+        and replace_where is not None
+    ):
+        raise UnsupportedOperationError(
+            "partition_filters and replace_where cannot be used together."
+        )
+    elif mode == WriteMode.OVERWRITE and partition_filters is not None:
+        # partition_filters are only supported with PyArrow engine
+        delta_write_options["engine"] = "pyarrow"
+        delta_write_options["partition_filters"] = partition_filters
+    elif mode == WriteMode.OVERWRITE and replace_where is not None:
+        delta_write_options["predicate"] = replace_where
+
+    _collect(df).write_delta(
+        target=path,
+        mode=_DELTA_WRITE_MODES[mode],
+        delta_write_options=delta_write_options,
+    )
+    if schema_evolution != SchemaEvolution.MERGE:
+        return schema_update
+    # Delta has already merged the schema during the write, so we only need to read the
+    # resulting schema once and compare it to Unity Catalog.
+    new_schema = df_schema_to_uc_schema(
+        df=pl.scan_delta(source=path),
+        partition_cols=partition_cols,
+    )
+    if check_schema_equality(left=new_schema, right=table.columns):
+        return None
+    return new_schema
+
+
+def _parquet_basename_template() -> str:
+    """
+    Returns a unique basename template for the files of one partitioned Parquet write.
+    A random UUID is already unique, so no timestamp is needed.
     """
-    Writes the Polars DataFrame `df` to the location of `table`.
+    return uuid.uuid4().hex + "-{i}.parquet"
 
-    Returns None if the schema in Unity Catalog does NOT need to be updated.
-    Returns a list[Column] if the schema in Unity Catalog DOES need to be updated.
 
-    If `partition_filters` is set, the table format is DELTA, and mode is OVERWRITE, then
-    only the partitions matching the filters will be overwritten.
+def _append_parquet(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    path: str,
+    mode: WriteMode,
+    schema_evolution: SchemaEvolution,
+    partition_filters: list[tuple[str, str, Any]] | None,
+    replace_where: str | None,
+) -> list[Column] | None:
+    partition_cols = table.partition_column_names
+    if len(partition_cols) == 0:
+        raise UnsupportedOperationError(
+            "Appending is only supported for PARQUET when partitioned."
+        )
+    raise_for_schema_mismatch(df=df, uc=table.columns)
+    _collect(df).write_parquet(
+        file=path,
+        use_pyarrow=True,
+        pyarrow_options={
+            "partition_cols": partition_cols,
+            "basename_template": _parquet_basename_template(),
+        },
+    )
+    return None
 
-    If `replace_where` is set, the table format is DELTA, and mode is OVERWRITE, then
-    only the rows matching the condition will be overwritten.
 
-    Raises UnsupportedOperationError for unsupported combination of `table.file_type`, `mode`, and `schema_evolution`.
+def _overwrite_parquet(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    path: str,
+    mode: WriteMode,
+    schema_evolution: SchemaEvolution,
+    partition_filters: list[tuple[str, str, Any]] | None,
+    replace_where: str | None,
+) -> list[Column] | None:
+    partition_cols = table.partition_column_names
+    schema_update = _schema_update(
+        df=df,
+        table=table,
+        schema_evolution=schema_evolution,
+        partition_cols=partition_cols,
+    )
+    if len(partition_cols) > 0:
+        _collect(df).write_parquet(
+            file=path,
+            use_pyarrow=True,
+            pyarrow_options={
+                "partition_cols": partition_cols,
+                "basename_template": _parquet_basename_template(),
+                "existing_data_behavior": "delete_matching",
+            },
+        )
+    elif isinstance(df, pl.LazyFrame):
+        _sink_to_file(
+            path=path,
+            sink=df.sink_parquet,
+            write=lambda file: _collect(df).write_parquet(file=file),
+        )
+    else:
+        df.write_parquet(file=path)
+    return schema_update
+
+
+def _overwrite_csv(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    path: str,
+    mode: WriteMode,
+    schema_evolution: SchemaEvolution,
+    partition_filters: list[tuple[str, str, Any]] | None,
+    replace_where: str | None,
+) -> list[Column] | None:
+    schema_update = _schema_update(
+        df=df, table=table, schema_evolution=schema_evolution, partition_cols=[]
+    )
+    if isinstance(df, pl.LazyFrame):
+        _sink_to_file(
+            path=path,
+            sink=df.sink_csv,
+            write=lambda file: _collect(df).write_csv(file=file),
+        )
+    else:
+        df.write_csv(file=path)
+    return schema_update
+
+
+def _overwrite_avro(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    path: str,
+    mode: WriteMode,
+    schema_evolution: SchemaEvolution,
+    partition_filters: list[tuple[str, str, Any]] | None,
+    replace_where: str | None,
+) -> list[Column] | None:
+    schema_update = _schema_update(
+        df=df, table=table, schema_evolution=schema_evolution, partition_cols=[]
+    )
+    _collect(df).write_avro(file=path)
+    return schema_update
+
+
+def _unsupported_write(message: str | None = None) -> _WriteHandler:
     """
-    path = table.storage_location
-    assert path is not None
-    if not path.startswith("file://"):
-        raise UnsupportedOperationError("Only local storage is supported.")
-    path = path.removeprefix("file://")
+    Returns a write handler that raises an UnsupportedOperationError with `message`,
+    or with the unsupported parameters if `message` is None.
+    """
+
+    def handler(
+        table: Table,
+        df: pl.DataFrame | pl.LazyFrame,
+        path: str,
+        mode: WriteMode,
+        schema_evolution: SchemaEvolution,
+        partition_filters: list[tuple[str, str, Any]] | None,
+        replace_where: str | None,
+    ) -> list[Column] | None:
+        raise UnsupportedOperationError(
+            message
+            if message is not None
+            else f"Unsupported parameters: {table.file_type}, {mode}, {schema_evolution}"
+        )
+
+    return handler
 
-    match table.file_type, mode, schema_evolution:
+
+def _select_write_handler(
+    file_type: FileType, mode: WriteMode, schema_evolution: SchemaEvolution
+) -> _WriteHandler:
+    match file_type, mode, schema_evolution:
         case _, WriteMode.APPEND, SchemaEvolution.OVERWRITE:
-            raise UnsupportedOperationError(
+            return _unsupported_write(
                 "Schema evolution OVERWRITE is only supported when write mode is also OVERWRITE."
             )
-
         case FileType.DELTA, _, _:
-            if schema_evolution == SchemaEvolution.STRICT:
-                raise_for_schema_mismatch(df=df, uc=table.columns)
-
-            delta_write_options: dict[str, Any] = {
-                "engine": "rust",
-            }
-
-            if schema_evolution == SchemaEvolution.OVERWRITE:
-                delta_write_options["schema_mode"] = "overwrite"
-            elif schema_evolution == SchemaEvolution.MERGE:
-                delta_write_options["schema_mode"] = "merge"
-
-            partition_cols = get_partition_columns(table.columns)
-            if len(partition_cols) > 0:
-                delta_write_options["partition_by"] = [
-                    col.name for col in partition_cols
-                ]
-
-            if (
-                mode == WriteMode.OVERWRITE
-                and partition_filters is not None
-                and replace_where is not None
-            ):
-                raise UnsupportedOperationError(
-                    "partition_filters and replace_where cannot be used together."
-                )
-            elif mode == WriteMode.OVERWRITE and partition_filters is not None:
-                # partition_filters are only supported with PyArrow engine
-                delta_write_options["engine"] = "pyarrow"
-                delta_write_options["partition_filters"] = partition_filters
-            elif mode == WriteMode.OVERWRITE and replace_where is not None:
-                delta_write_options["predicate"] = replace_where
-
-            df.write_delta(
-                target=path,
-                mode=cast(Literal["append", "overwrite"], mode.value.lower()),
-                delta_write_options=delta_write_options,
-            )
-            if schema_evolution != SchemaEvolution.STRICT:
-                lf = pl.scan_delta(source=path)
-                try:
-                    raise_for_schema_mismatch(df=lf, uc=table.columns)
-                    return None
-                except SchemaMismatchError:
-                    return df_schema_to_uc_schema(
-                        df=lf, partition_cols=[col.name for col in partition_cols]
-                    )
-            else:
-                return None
-
+            return _write_delta
         case FileType.PARQUET, WriteMode.APPEND, SchemaEvolution.STRICT:
-            partition_cols = get_partition_columns(table.columns)
-            if len(partition_cols) == 0:
-                raise UnsupportedOperationError(
-                    "Appending is only supported for PARQUET when partitioned."
-                )
-            raise_for_schema_mismatch(df=df, uc=table.columns)
-            df.write_parquet(
-                file=path,
-                use_pyarrow=True,
-                pyarrow_options={
-                    "partition_cols": [col.name for col in partition_cols],
-                    "basename_template": str(uuid.uuid4())
-                    + str(time.time()).replace(".", "")
-                    + "-{i}.parquet",
-                },
-            )
-            return None
-
+            return _append_parquet
         case FileType.PARQUET, WriteMode.OVERWRITE, _:
-            if schema_evolution == SchemaEvolution.STRICT:
-                raise_for_schema_mismatch(df=df, uc=table.columns)
-            partition_cols = get_partition_columns(table.columns)
-            if len(partition_cols) > 0:
-                df.write_parquet(
-                    file=path,
-                    use_pyarrow=True,
-                    pyarrow_options={
-                        "partition_cols": [col.name for col in partition_cols],
-                        "basename_template": str(uuid.uuid4())
-                        + str(time.time()).replace(".", "")
-                        + "-{i}.parquet",
-                        "existing_data_behavior": "delete_matching",
-                    },
-                )
-            else:
-                df.write_parquet(file=path)
-            try:
-                raise_for_schema_mismatch(df=df, uc=table.columns)
-                return None
-            except SchemaMismatchError:
-                return df_schema_to_uc_schema(
-                    df=df, partition_cols=[col.name for col in partition_cols]
-                )
-
-        case FileType.CSV, WriteMode.OVERWRITE, SchemaEvolution.STRICT:
-            raise_for_schema_mismatch(df=df, uc=table.columns)
-            df.write_csv(file=path)
-            return None
-
-        case FileType.CSV, WriteMode.OVERWRITE, SchemaEvolution.OVERWRITE:
-            df.write_csv(file=path)
-            try:
-                raise_for_schema_mismatch(df=df, uc=table.columns)
-                return None
-            except SchemaMismatchError:
-                return df_schema_to_uc_schema(df=df)
-
-        case FileType.AVRO, WriteMode.OVERWRITE, SchemaEvolution.STRICT:
-            raise_for_schema_mismatch(df=df, uc=table.columns)
-            df.write_avro(file=path)
-            return None
-
-        case FileType.AVRO, WriteMode.OVERWRITE, SchemaEvolution.OVERWRITE:
-            df.write_avro(file=path)
-            try:
-                raise_for_schema_mismatch(df=df, uc=table.columns)
-                return None
-            except SchemaMismatchError:
-                return df_schema_to_uc_schema(df=df)
-
+            return _overwrite_parquet
+        case (
+            FileType.CSV,
+            WriteMode.OVERWRITE,
+            (SchemaEvolution.STRICT | SchemaEvolution.OVERWRITE),
+        ):
+            return _overwrite_csv
+        case (
+            FileType.AVRO,
+            WriteMode.OVERWRITE,
+            (SchemaEvolution.STRICT | SchemaEvolution.OVERWRITE),
+        ):
+            return _overwrite_avro
         case _, WriteMode.APPEND, _:
-            raise UnsupportedOperationError(
+            return _unsupported_write(
                 "Write mode APPEND is only supported for DELTA and partitioned PARQUET. For PARQUET, schema evolution must also be STRICT."
             )
-
         case _, _, SchemaEvolution.MERGE:
-            raise UnsupportedOperationError(
+            return _unsupported_write(
                 "Schema evolution MERGE is only supported for DELTA."
             )
-
         case _, _, SchemaEvolution.OVERWRITE:
-            raise UnsupportedOperationError(
+            return _unsupported_write(
                 "Schema evolution OVERWRITE is only supported when write mode is also OVERWRITE."
             )
-
         case _:
-            raise UnsupportedOperationError(
-                f"Unsupported parameters: {table.file_type}, {mode}, {schema_evolution}"
-            )
+            return _unsupported_write()
+
+
+# Write handler for every combination of file type, write mode, and schema evolution.
+# Built once at import so that write_table only needs a single dict lookup.
+_WRITE_HANDLERS: dict[tuple[FileType, WriteMode, SchemaEvolution], _WriteHandler] = {
+    (file_type, mode, schema_evolution): _select_write_handler(
+        file_type=file_type, mode=mode, schema_evolution=schema_evolution
+    )
+    for file_type in FileType
+    for mode in WriteMode
+    for schema_evolution in SchemaEvolution
+}
+
+
+def write_table(
+    table: Table,
+    df: pl.DataFrame | pl.LazyFrame,
+    mode: WriteMode,
+    schema_evolution: SchemaEvolution,
+    partition_filters: list[tuple[str, str, Any]] | None = None,
+    replace_where: str | None = None,
+) -> list[Column] | None:
+    """
+    Writes the Polars DataFrame or LazyFrame `df` to the location of `table`.
+
+    LazyFrames are streamed directly to the file for single file Parquet and CSV. For other
+    formats they are collected with the streaming engine before writing.
+
+    Returns None if the schema in Unity Catalog does NOT need to be updated.
+    Returns a list[Column] if the schema in Unity Catalog DOES need to be updated.
+
+    If `partition_filters` is set, the table format is DELTA, and mode is OVERWRITE, then
+    only the partitions matching the filters will be overwritten.
+
+    If `replace_where` is set, the table format is DELTA, and mode is OVERWRITE, then
+    only the rows matching the condition will be overwritten.
+
+    Raises UnsupportedOperationError for unsupported combination of `table.file_type`, `mode`, and `schema_evolution`.
+    """
+    path = table.local_path
+    handler = _WRITE_HANDLERS[(table.file_type, mode, schema_evolution)]
+    return handler(
+        table, df, path, mode, schema_evolution, partition_filters, replace_where
+    )
 
 
 def merge_table(
@@ -461,11 +881,7 @@ def merge_table(
 
     This method only supports exactly matching schemas.
     """
-    path = table.storage_location
-    assert path is not None
-    if not path.startswith("file://"):
-        raise UnsupportedOperationError("Only local storage is supported.")
-    path = path.removeprefix("file://")
+    path = table.local_path
 
     if table.file_type != FileType.DELTA:
         raise UnsupportedOperationError("merge_table only supports DELTA tables.")
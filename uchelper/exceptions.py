@@ -25,4 +25,4 @@ class SchemaMismatchError(Exception):
 
 class DuckDBConnectionSetupError(Exception):
     def __init__(self) -> None:
-        self.msg = "Failed to setup DuckDB connection to Unity Catalog when creating this UCClient object."
+        self.msg = "Failed to setup DuckDB connection to Unity Catalog for this UCClient object."
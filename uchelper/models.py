@@ -1,8 +1,14 @@
 from pydantic import BaseModel, Field, ConfigDict, computed_field
 from enum import Enum
+from operator import attrgetter
+from typing import Any, Callable, TYPE_CHECKING
 import datetime
 import uuid
-import json
+import orjson
+from .exceptions import UnsupportedOperationError
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 TABLE_DEFAULT_MERGE_COLUMNS_PROPERTY_KEY = (
@@ -131,7 +137,7 @@ class Column(BaseModel):
             "nullable": self.nullable,
             "metadata": {},
         }
-        return json.dumps(dct)
+        return orjson.dumps(dct).decode()
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -172,6 +178,18 @@ class FileType(str, Enum):
     TEXT = "TEXT"
 
 
+def get_partition_columns(cols: list[Column]) -> list[Column]:
+    partition_cols = [col for col in cols if col.partition_index is not None]
+    # Columns from Unity Catalog are usually already in partition order, so only sort
+    # when they are not.
+    if all(
+        prev.partition_index <= col.partition_index  # type: ignore[operator]
+        for prev, col in zip(partition_cols, partition_cols[1:])
+    ):
+        return partition_cols
+    return sorted(partition_cols, key=attrgetter("partition_index"))
+
+
 class Table(BaseModel):
     """
     Model for a Table in Unity Catalog.
@@ -212,3 +230,91 @@ class Table(BaseModel):
                     "Broken metadata: table has default_merge_column that is not a column in the table."
                 )
         return merge_cols
+
+    def _cached_on_columns(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the value cached under `key`, computing it with `compute` if the cache is
+        empty or `columns` has been reassigned since. The cache lives in `__dict__` like a
+        `cached_property`, so it is not part of equality checks or serialization.
+        """
+        cached = self.__dict__.get(key)
+        if cached is None or cached[0] is not self.columns:
+            cached = (self.columns, compute())
+            self.__dict__[key] = cached
+        return cached[1]
+
+    @property
+    def partition_columns(self) -> list[Column]:
+        """
+        The partition columns of the table sorted by `partition_index`.
+        Cached until `columns` is reassigned; do not modify the returned list.
+        """
+        return self._cached_on_columns(
+            "_partition_columns_cache", lambda: get_partition_columns(self.columns)
+        )
+
+    @property
+    def partition_column_names(self) -> list[str]:
+        """
+        The names of the partition columns of the table sorted by `partition_index`.
+        Cached until `columns` is reassigned; do not modify the returned list.
+        """
+        return self._cached_on_columns(
+            "_partition_column_names_cache",
+            lambda: [col.name for col in self.partition_columns],
+        )
+
+    @property
+    def hive_schema(self) -> dict[str, "pl.DataType"]:
+        """
+        The Polars schema of the partition columns, for reading hive partitioned files.
+        Cached until `columns` is reassigned; do not modify the returned dict.
+        """
+        from .dataframe import uc_type_to_polars_type
+
+        return self._cached_on_columns(
+            "_hive_schema_cache",
+            lambda: {
+                col.name: uc_type_to_polars_type(col.data_type)
+                for col in self.partition_columns
+            },
+        )
+
+    @property
+    def local_path(self) -> str:
+        """
+        The local filesystem path of the table, i.e. `storage_location` without the
+        file:// prefix.
+
+        Raises an UnsupportedOperationError if the table is not stored in the local filesystem.
+        """
+        path = self.storage_location
+        if path is None or not path.startswith("file://"):
+            raise UnsupportedOperationError("Only local storage is supported.")
+        return path.removeprefix("file://")
+
+
+class WriteMode(str, Enum):
+    """
+    Mode for writing to a table.
+    Possible values:
+        - APPEND
+        - OVERWRITE
+    """
+
+    APPEND = "APPEND"
+    OVERWRITE = "OVERWRITE"
+
+
+class SchemaEvolution(str, Enum):
+    """
+    How to handle schema mismatches when writing to a table.
+    Possible values:
+        - STRICT
+        - MERGE
+        - OVERWRITE
+    """
+
+    STRICT = "STRICT"
+    MERGE = "MERGE"
+    OVERWRITE = "OVERWRITE"
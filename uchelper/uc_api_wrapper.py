@@ -4,56 +4,139 @@ Functions for handling calling Unity Catalog REST API endpoints and parsing resu
 
 from .exceptions import AlreadyExistsError, DoesNotExistError, UnsupportedOperationError
 from .models import *
-from deltalake import DeltaTable
+from pydantic import BaseModel, TypeAdapter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote
+from typing import Any, TYPE_CHECKING
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
+
+if TYPE_CHECKING:
+    from deltalake import DeltaTable
 
 # error_code the Unity Catalog REST API returns if something was not found
 SERVER_NOT_FOUND_ERROR = "NOT_FOUND"
 # error_code the Unity Catalog REST API returns if something to be created already exists
 SERVER_ALREADY_EXISTS_ERROR = "ALREADY_EXISTS"
+# Exceptions raised for the error_codes that have their own exception type
+SERVER_ERRORS: dict[str, type[Exception]] = {
+    SERVER_ALREADY_EXISTS_ERROR: AlreadyExistsError,
+    SERVER_NOT_FOUND_ERROR: DoesNotExistError,
+}
 
 JSON_HEADER = {"Content-Type": "application/json"}
+# Size of the connection pool of sessions created with make_session
+SESSION_POOL_SIZE = 32
+# Default number of concurrent requests in the *_bulk functions; kept below SESSION_POOL_SIZE
+BULK_MAX_WORKERS = 16
 
 api_path = "/api/2.1/unity-catalog"
 catalogs_endpoint = "/catalogs"
 schemas_endpoint = "/schemas"
 tables_endpoint = "/tables"
+# Full paths of the endpoints, joined once here instead of on every request.
+catalogs_path = api_path + catalogs_endpoint
+schemas_path = api_path + schemas_endpoint
+tables_path = api_path + tables_endpoint
+
+
+# Serializes the columns of a table for create_table in one pydantic-core call
+_COLUMNS_ADAPTER = TypeAdapter(list[Column])
 
 
-def _check_already_exists_response(response: requests.Response):
+@lru_cache(maxsize=4096)
+def _quote(name: str) -> str:
     """
-    Helper function to check if Unity Catalog responded with an ALREADY_EXISTS error.
-    Raises an AlreadyExistsError if yes.
+    Helper function to percent-encode a catalog/schema/table name for use in a URL path.
+    Cached since the same few names are used over and over.
     """
-    if not response.ok:
-        response_dict = response.json()
-        if response_dict.get("error_code", "").upper() == SERVER_ALREADY_EXISTS_ERROR:
-            raise AlreadyExistsError(response_dict.get("message", ""))
+    return quote(name, safe="")
 
 
-def _check_does_not_exist_response(response: requests.Response):
+class _CatalogsPage(BaseModel):
     """
-    Helper function to check if Unity Catalog responded with a NOT_FOUND error.
-    Raises a DoesNotExistError if yes.
+    One page of the response of the list catalogs endpoint.
     """
-    if not response.ok:
-        response_dict = response.json()
-        if response_dict.get("error_code", "").upper() == SERVER_NOT_FOUND_ERROR:
-            raise DoesNotExistError(response_dict.get("message", ""))
 
+    catalogs: list[Catalog] = []
+    next_page_token: str | None = None
 
-def _check_response_failed(response: requests.Response):
+
+class _SchemasPage(BaseModel):
     """
-    Helper function to raise an Exception with the error message if Unity Catalog responded
-    with any error.
-    Raises an Exception.
+    One page of the response of the list schemas endpoint.
     """
-    if not response.ok:
-        response_dict = response.json()
-        raise Exception(
-            f"Something went wrong. Server response:\n{response_dict.get('message', response.text)}"
-        )
+
+    schemas: list[Schema] = []
+    next_page_token: str | None = None
+
+
+class _TablesPage(BaseModel):
+    """
+    One page of the response of the list tables endpoint.
+    """
+
+    tables: list[Table] = []
+    next_page_token: str | None = None
+
+
+def make_session(pool_size: int = SESSION_POOL_SIZE) -> requests.Session:
+    """
+    Creates a requests Session for calling the Unity Catalog REST API with the functions
+    in this module:
+        - connections are kept alive in a pool of `pool_size` connections,
+        - connection errors, and 502/503/504 responses to idempotent requests, are retried
+          with a short backoff,
+        - JSON_HEADER is sent with every request, so it is not passed per call.
+    """
+    session = requests.Session()
+    session.headers.update(JSON_HEADER)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _json(response: requests.Response) -> Any:
+    """
+    Helper function to parse the JSON body of a Unity Catalog response.
+    Uses orjson since it is considerably faster than the stdlib json used by `response.json()`.
+    """
+    return orjson.loads(response.content)
+
+
+def _check_response(response: requests.Response, *error_codes: str):
+    """
+    Helper function to raise an Exception if Unity Catalog responded with an error.
+    The error body is parsed only once.
+    If the error_code of the response is one of `error_codes`, raises the matching exception
+    from SERVER_ERRORS; otherwise raises an Exception with the error message.
+    """
+    if response.ok:
+        return
+    response_dict = _json(response)
+    error_code = response_dict.get("error_code", "").upper()
+    if error_code in error_codes:
+        raise SERVER_ERRORS[error_code](response_dict.get("message", ""))
+    message = response_dict.get("message")
+    if message is None:
+        message = response.content.decode(errors="replace")
+    raise Exception(f"Something went wrong. Server response:\n{message}")
 
 
 def health_check(session: requests.Session, uc_url: str) -> bool:
@@ -66,7 +149,7 @@ def health_check(session: requests.Session, uc_url: str) -> bool:
         if not response.ok:
             return False
 
-        return "Hello, Unity Catalog!" in response.text
+        return b"Hello, Unity Catalog!" in response.content
 
     except requests.exceptions.ConnectionError:
         return False
@@ -90,13 +173,40 @@ def create_catalog(session: requests.Session, uc_url: str, catalog: Catalog) ->
         "comment": catalog.comment,
         "properties": catalog.properties,
     }
-    url = uc_url + api_path + catalogs_endpoint
-    response = session.post(url, data=json.dumps(data), headers=JSON_HEADER)
+    url = uc_url + catalogs_path
+    response = session.post(url, data=orjson.dumps(data))
+
+    _check_response(response, SERVER_ALREADY_EXISTS_ERROR)
 
-    _check_already_exists_response(response=response)
-    _check_response_failed(response=response)
+    return Catalog.model_validate_json(response.content)
 
-    return Catalog.model_validate_json(response.text)
+
+def create_catalogs_bulk(
+    session: requests.Session,
+    uc_url: str,
+    catalogs: list[Catalog],
+    max_workers: int = BULK_MAX_WORKERS,
+) -> list[Catalog]:
+    """
+    Creates all the catalogs in `catalogs` like `create_catalog` and returns the created
+    Catalogs in the same order.
+    Unity Catalog has no batch endpoint, so the catalogs are created concurrently with at
+    most `max_workers` requests in flight; `max_workers` should not exceed the connection
+    pool size of `session`.
+    If creating any of the catalogs fails, e.g. with an AlreadyExistsError, the first error
+    is raised once all requests have finished; the other catalogs are still created.
+    """
+    if not catalogs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(catalogs))) as executor:
+        futures = [
+            executor.submit(
+                create_catalog, session=session, uc_url=uc_url, catalog=catalog
+            )
+            for catalog in catalogs
+        ]
+    return [future.result() for future in futures]
 
 
 def delete_catalog(
@@ -111,50 +221,53 @@ def delete_catalog(
     Returns True/False indicating if a catalog was deleted.
     Raises a DoesNotExistError if a catalog with the name does not exist.
     """
-    url = uc_url + api_path + catalogs_endpoint + "/" + name
+    url = f"{uc_url}{catalogs_path}/{_quote(name)}"
     # If we don't convert the boolean `force` to a _lowercase_ string,
     # requests sets the query parameter to ?force=True or ?force=False
     # which the Unity Catalog server does not parse properly.
     response = session.delete(url, params={"force": ("true" if force else "false")})
 
-    _check_does_not_exist_response(response=response)
-
     if response.ok:
         return True
 
-    if "Cannot delete catalog with schemas" in response.text:
+    if b"Cannot delete catalog with schemas" in response.content:
         return False
 
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
     return False  # superfluous return that is never reached just to make mypy happy
 
 
-def list_catalogs(session: requests.Session, uc_url: str) -> list[Catalog]:
+def iter_catalogs(session: requests.Session, uc_url: str) -> Iterator[Catalog]:
     """
-    Returns a list of catalogs from the specified Unity Catalog.
+    Returns an iterator of the catalogs in the specified Unity Catalog.
+    Catalogs are yielded page by page as the pages are fetched, so only one page is kept
+    in memory at a time.
     """
-    catalogs = []
     token = None
 
     while True:
         response = session.get(
-            uc_url + api_path + catalogs_endpoint,
+            uc_url + catalogs_path,
             params={"page_token": token},
-        ).json()
-        token = response["next_page_token"]
-        catalogs.extend(
-            [
-                Catalog.model_validate(catalog, strict=False)
-                for catalog in response["catalogs"]
-            ]
         )
+
+        _check_response(response)
+
+        catalogs_page = _CatalogsPage.model_validate_json(response.content)
+        token = catalogs_page.next_page_token
+        yield from catalogs_page.catalogs
         # according to API spec, token should be null when there are no more pages,
         # but at least some endpoints have been bugged and returned "" instead of null
-        if token is None or token == "":
+        if not token:
             break
 
-    return catalogs
+
+def list_catalogs(session: requests.Session, uc_url: str) -> list[Catalog]:
+    """
+    Returns a list of catalogs from the specified Unity Catalog.
+    """
+    return list(iter_catalogs(session=session, uc_url=uc_url))
 
 
 def get_catalog(session: requests.Session, uc_url: str, name: str) -> Catalog:
@@ -162,13 +275,12 @@ def get_catalog(session: requests.Session, uc_url: str, name: str) -> Catalog:
     Returns the info of the catalog with the specified name, if it exists.
     Raises a DoesNotExistError if a catalog with the name does not exist.
     """
-    url = uc_url + api_path + catalogs_endpoint + "/" + name
+    url = f"{uc_url}{catalogs_path}/{_quote(name)}"
     response = session.get(url)
 
-    _check_does_not_exist_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
-    return Catalog.model_validate_json(response.text)
+    return Catalog.model_validate_json(response.content)
 
 
 def update_catalog(
@@ -188,14 +300,12 @@ def update_catalog(
         "comment": catalog.comment,
         "properties": catalog.properties,
     }
-    url = uc_url + api_path + catalogs_endpoint + "/" + name
-    response = session.patch(url, data=json.dumps(data), headers=JSON_HEADER)
+    url = f"{uc_url}{catalogs_path}/{_quote(name)}"
+    response = session.patch(url, data=orjson.dumps(data))
 
-    _check_already_exists_response(response=response)
-    _check_does_not_exist_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_ALREADY_EXISTS_ERROR, SERVER_NOT_FOUND_ERROR)
 
-    return Catalog.model_validate_json(response.text)
+    return Catalog.model_validate_json(response.content)
 
 
 def create_schema(session: requests.Session, uc_url: str, schema: Schema) -> Schema:
@@ -208,19 +318,18 @@ def create_schema(session: requests.Session, uc_url: str, schema: Schema) -> Sch
     Returns a new Schema with the remaining fields populated.
     Raises an AlreadyExistsError if a schema with the name already exists in the same catalog.
     """
-    url = uc_url + api_path + schemas_endpoint
+    url = uc_url + schemas_path
     data = {
         "name": schema.name,
         "catalog_name": schema.catalog_name,
         "comment": schema.comment,
         "properties": schema.properties,
     }
-    response = session.post(url, data=json.dumps(data), headers=JSON_HEADER)
+    response = session.post(url, data=orjson.dumps(data))
 
-    _check_already_exists_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_ALREADY_EXISTS_ERROR)
 
-    return Schema.model_validate_json(response.text)
+    return Schema.model_validate_json(response.content)
 
 
 def delete_schema(
@@ -235,21 +344,19 @@ def delete_schema(
     Returns True/False indicating if a schema was deleted.
     Raises a DoesNotExistError if a schema with the name does not exist.
     """
-    url = uc_url + api_path + schemas_endpoint + "/" + catalog + "." + schema
+    url = f"{uc_url}{schemas_path}/{_quote(catalog)}.{_quote(schema)}"
     # If we don't convert the boolean `force` to a _lowercase_ string,
     # requests sets the query parameter to ?force=True or ?force=False
     # which the Unity Catalog server does not parse properly.
     response = session.delete(url, params={"force": ("true" if force else "false")})
 
-    _check_does_not_exist_response(response=response)
-
     if response.ok:
         return True
 
-    if "Cannot delete schema with tables" in response.text:
+    if b"Cannot delete schema with tables" in response.content:
         return False
 
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
     return False  # superfluous return that is never reached just to make mypy happy
 
@@ -261,22 +368,24 @@ def get_schema(
     Returns the info of the schema in the catalog, if it exists.
     Raises a DoesNotExistException if the schema or catalog does not exist.
     """
-    url = uc_url + api_path + schemas_endpoint + "/" + catalog + "." + schema
+    url = f"{uc_url}{schemas_path}/{_quote(catalog)}.{_quote(schema)}"
     response = session.get(url)
 
-    _check_does_not_exist_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
-    return Schema.model_validate_json(response.text)
+    return Schema.model_validate_json(response.content)
 
 
-def list_schemas(session: requests.Session, uc_url: str, catalog: str) -> list[Schema]:
+def iter_schemas(
+    session: requests.Session, uc_url: str, catalog: str
+) -> Iterator[Schema]:
     """
-    Returns a list of schemas in the specified catalog from Unity Catalog.
+    Returns an iterator of the schemas in the specified catalog from Unity Catalog.
+    Schemas are yielded page by page as the pages are fetched, so only one page is kept
+    in memory at a time.
+    Raises a DoesNotExistError if the catalog does not exist.
     """
-    url = uc_url + api_path + schemas_endpoint
-
-    schemas = []
+    url = uc_url + schemas_path
     token = None
 
     while True:
@@ -285,21 +394,45 @@ def list_schemas(session: requests.Session, uc_url: str, catalog: str) -> list[S
             params={"page_token": token, "catalog_name": catalog},
         )
 
-        _check_does_not_exist_response(response=response)
-        _check_response_failed(response=response)
+        _check_response(response, SERVER_NOT_FOUND_ERROR)
 
-        response_dict = response.json()
-        token = response_dict["next_page_token"]
-        schemas.extend(
-            [
-                Schema.model_validate(schema, strict=False)
-                for schema in response_dict["schemas"]
-            ]
-        )
-        if token is None or token == "":
+        schemas_page = _SchemasPage.model_validate_json(response.content)
+        token = schemas_page.next_page_token
+        yield from schemas_page.schemas
+        if not token:
             break
 
-    return schemas
+
+def list_schemas(session: requests.Session, uc_url: str, catalog: str) -> list[Schema]:
+    """
+    Returns a list of schemas in the specified catalog from Unity Catalog.
+    """
+    return list(iter_schemas(session=session, uc_url=uc_url, catalog=catalog))
+
+
+def list_schemas_bulk(
+    session: requests.Session,
+    uc_url: str,
+    catalogs: list[str],
+    max_workers: int = BULK_MAX_WORKERS,
+) -> dict[str, list[Schema]]:
+    """
+    Returns the schemas in each of the specified catalogs, keyed by catalog name.
+    The catalogs are listed concurrently with at most `max_workers` requests in flight,
+    so `max_workers` should not exceed the connection pool size of `session`.
+    Raises a DoesNotExistError if any of the catalogs does not exist.
+    """
+    if not catalogs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(catalogs))) as executor:
+        results = executor.map(
+            lambda catalog: list_schemas(
+                session=session, uc_url=uc_url, catalog=catalog
+            ),
+            catalogs,
+        )
+        return dict(zip(catalogs, results))
 
 
 def update_schema(
@@ -320,19 +453,17 @@ def update_schema(
     Raises an AlreadyExistsError if there already exists a schema with the new name
     in the same catalog.
     """
-    url = uc_url + api_path + schemas_endpoint + "/" + catalog + "." + schema_name
+    url = f"{uc_url}{schemas_path}/{_quote(catalog)}.{_quote(schema_name)}"
     data = {
         "comment": new_schema.comment,
         "properties": new_schema.properties,
         "new_name": (new_schema.name if new_schema.name != schema_name else None),
     }
-    response = session.patch(url=url, data=json.dumps(data), headers=JSON_HEADER)
+    response = session.patch(url=url, data=orjson.dumps(data))
 
-    _check_does_not_exist_response(response=response)
-    _check_already_exists_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR, SERVER_ALREADY_EXISTS_ERROR)
 
-    return Schema.model_validate_json(response.text)
+    return Schema.model_validate_json(response.content)
 
 
 def create_table(session: requests.Session, uc_url: str, table: Table) -> Table:
@@ -350,24 +481,23 @@ def create_table(session: requests.Session, uc_url: str, table: Table) -> Table:
     Returns a new Table with the remaining fields populated.
     Raises an AlreadyExistsError if a Table with the name already exists in the same catalog.
     """
-    url = uc_url + api_path + tables_endpoint
+    url = uc_url + tables_path
     data = {
         "name": table.name,
         "catalog_name": table.catalog_name,
         "schema_name": table.schema_name,
         "table_type": table.table_type,
         "data_source_format": table.file_type,
-        "columns": [col.model_dump(by_alias=True) for col in table.columns],
+        "columns": _COLUMNS_ADAPTER.dump_python(table.columns, by_alias=True),
         "storage_location": table.storage_location,
         "comment": table.comment,
         "properties": table.properties,
     }
-    response = session.post(url, data=json.dumps(data), headers=JSON_HEADER)
+    response = session.post(url, data=orjson.dumps(data))
 
-    _check_already_exists_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_ALREADY_EXISTS_ERROR)
 
-    return Table.model_validate_json(response.text)
+    return Table.model_validate_json(response.content)
 
 
 def delete_table(
@@ -377,13 +507,10 @@ def delete_table(
     Deletes the table.
     Raises a DoesNotExistError if the table did not exist.
     """
-    url = (
-        uc_url + api_path + tables_endpoint + "/" + catalog + "." + schema + "." + table
-    )
+    url = f"{uc_url}{tables_path}/{_quote(catalog)}.{_quote(schema)}.{_quote(table)}"
     response = session.delete(url)
 
-    _check_does_not_exist_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
 
 def get_table(
@@ -393,26 +520,24 @@ def get_table(
     Returns the info of the table, if it exists.
     Raises a DoesNotExistException if the table does not exist.
     """
-    url = (
-        uc_url + api_path + tables_endpoint + "/" + catalog + "." + schema + "." + table
-    )
+    url = f"{uc_url}{tables_path}/{_quote(catalog)}.{_quote(schema)}.{_quote(table)}"
     response = session.get(url)
 
-    _check_does_not_exist_response(response=response)
-    _check_response_failed(response=response)
+    _check_response(response, SERVER_NOT_FOUND_ERROR)
 
-    return Table.model_validate_json(response.text)
+    return Table.model_validate_json(response.content)
 
 
-def list_tables(
+def iter_tables(
     session: requests.Session, uc_url: str, catalog: str, schema: str
-) -> list[Table]:
+) -> Iterator[Table]:
     """
-    Returns a list of tables in the specified catalog.schema from Unity Catalog.
+    Returns an iterator of the tables in the specified catalog.schema from Unity Catalog.
+    Tables are yielded page by page as the pages are fetched, so only one page is kept
+    in memory at a time.
+    Raises a DoesNotExistError if the catalog or schema does not exist.
     """
-    url = uc_url + api_path + tables_endpoint
-
-    tables = []
+    url = uc_url + tables_path
     token = None
 
     while True:
@@ -425,21 +550,50 @@ def list_tables(
             },
         )
 
-        _check_does_not_exist_response(response=response)
-        _check_response_failed(response=response)
+        _check_response(response, SERVER_NOT_FOUND_ERROR)
 
-        response_dict = response.json()
-        token = response_dict["next_page_token"]
-        tables.extend(
-            [
-                Table.model_validate(table, strict=False)
-                for table in response_dict["tables"]
-            ]
-        )
-        if token is None or token == "":
+        tables_page = _TablesPage.model_validate_json(response.content)
+        token = tables_page.next_page_token
+        yield from tables_page.tables
+        if not token:
             break
 
-    return tables
+
+def list_tables(
+    session: requests.Session, uc_url: str, catalog: str, schema: str
+) -> list[Table]:
+    """
+    Returns a list of tables in the specified catalog.schema from Unity Catalog.
+    """
+    return list(
+        iter_tables(session=session, uc_url=uc_url, catalog=catalog, schema=schema)
+    )
+
+
+def list_tables_bulk(
+    session: requests.Session,
+    uc_url: str,
+    catalog: str,
+    schemas: list[str],
+    max_workers: int = BULK_MAX_WORKERS,
+) -> dict[str, list[Table]]:
+    """
+    Returns the tables in each of the specified schemas of `catalog`, keyed by schema name.
+    The schemas are listed concurrently with at most `max_workers` requests in flight,
+    so `max_workers` should not exceed the connection pool size of `session`.
+    Raises a DoesNotExistError if the catalog or any of the schemas does not exist.
+    """
+    if not schemas:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(schemas))) as executor:
+        results = executor.map(
+            lambda schema: list_tables(
+                session=session, uc_url=uc_url, catalog=catalog, schema=schema
+            ),
+            schemas,
+        )
+        return dict(zip(schemas, results))
 
 
 def update_table(
@@ -467,7 +621,12 @@ def update_table(
     return overwrite_table(session=session, uc_url=uc_url, table=existing_table)
 
 
-def overwrite_table(session: requests.Session, uc_url: str, table: Table) -> Table:
+def overwrite_table(
+    session: requests.Session,
+    uc_url: str,
+    table: Table,
+    original_table: Table | None = None,
+) -> Table:
     """
     Overwrites a table with the following fields specified in the parameter `table`:
         - name,
@@ -481,16 +640,19 @@ def overwrite_table(session: requests.Session, uc_url: str, table: Table) -> Tab
         - properties.
     Returns a new Table with the remaining fields populated.
     Raises a DoesNotExistException if the table does not already exist.
+
+    If `original_table` is given, it is used as the current state of the table, and
+    restored if creating the new table fails, instead of fetching it from Unity Catalog.
     """
-    original_table = None
     try:
-        original_table = get_table(
-            session=session,
-            uc_url=uc_url,
-            catalog=table.catalog_name,
-            schema=table.schema_name,
-            table=table.name,
-        )
+        if original_table is None:
+            original_table = get_table(
+                session=session,
+                uc_url=uc_url,
+                catalog=table.catalog_name,
+                schema=table.schema_name,
+                table=table.name,
+            )
         delete_table(
             session=session,
             uc_url=uc_url,
@@ -552,7 +714,7 @@ def set_table_default_merge_columns(
 
 def get_delta_table(
     table: Table,
-) -> DeltaTable:
+) -> "DeltaTable":
     """
     Helper function to return a `Table` as a `DeltaTable`.
 
@@ -561,6 +723,8 @@ def get_delta_table(
     if table.file_type != FileType.DELTA:
         raise UnsupportedOperationError("The table is not DELTA.")
     assert table.storage_location is not None
+    from deltalake import DeltaTable
+
     return DeltaTable(table_uri=table.storage_location)
 
 
@@ -570,15 +734,24 @@ def sync_delta_properties(
     catalog: str,
     schema: str,
     name: str,
+    table: Table | None = None,
+    dt: "DeltaTable | None" = None,
 ) -> Table:
     """
     Syncs the properties of the underlying Delta table with Unity Catalog.
     These are the properties starting with 'delta.'
+
+    If the caller already has the `Table` and/or its `DeltaTable` at hand, they can be
+    passed as `table` and `dt` to skip fetching them again. `table` is not modified.
     """
-    table = get_table(
-        session=session, uc_url=uc_url, catalog=catalog, schema=schema, table=name
-    )
-    dt = get_delta_table(table=table)
+    if table is None:
+        table = get_table(
+            session=session, uc_url=uc_url, catalog=catalog, schema=schema, table=name
+        )
+    else:
+        table = table.model_copy(deep=True)
+    if dt is None:
+        dt = get_delta_table(table=table)
     if table.properties is None:
         table.properties = {}
     table.properties = {
@@ -1,60 +1,99 @@
-from .models import TableType, FileType
-from .dataframe import WriteMode, SchemaEvolution
+from .models import TableType, FileType, WriteMode, SchemaEvolution
 from .exceptions import UnsupportedOperationError
-from typing import Literal
+from typing import Generic, Literal, TypeVar
+import time
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+_TABLETYPES: dict[str, TableType] = {
+    "managed": TableType.MANAGED,
+    "external": TableType.EXTERNAL,
+}
+_FILETYPES: dict[str, FileType] = {
+    "delta": FileType.DELTA,
+    "csv": FileType.CSV,
+    "json": FileType.JSON,
+    "avro": FileType.AVRO,
+    "parquet": FileType.PARQUET,
+    "orc": FileType.ORC,
+    "text": FileType.TEXT,
+}
+_WRITEMODES: dict[str, WriteMode] = {
+    "append": WriteMode.APPEND,
+    "overwrite": WriteMode.OVERWRITE,
+}
+_SCHEMAEVOLUTIONS: dict[str, SchemaEvolution] = {
+    "strict": SchemaEvolution.STRICT,
+    "merge": SchemaEvolution.MERGE,
+    "overwrite": SchemaEvolution.OVERWRITE,
+}
 
 
 def literal_to_tabletype(lit: Literal["managed", "external"]) -> TableType:
-    match lit:
-        case "managed":
-            return TableType.MANAGED
-        case "external":
-            return TableType.EXTERNAL
-        case _:
-            raise UnsupportedOperationError(f"{lit} is not a valid TableType.")
+    tabletype = _TABLETYPES.get(lit)
+    if tabletype is None:
+        raise UnsupportedOperationError(f"{lit} is not a valid TableType.")
+    return tabletype
 
 
 def literal_to_filetype(
     lit: Literal["delta", "csv", "json", "avro", "parquet", "orc", "text"]
 ) -> FileType:
-    match lit:
-        case "delta":
-            return FileType.DELTA
-        case "csv":
-            return FileType.CSV
-        case "json":
-            return FileType.JSON
-        case "avro":
-            return FileType.AVRO
-        case "parquet":
-            return FileType.PARQUET
-        case "orc":
-            return FileType.ORC
-        case "text":
-            return FileType.TEXT
-        case _:
-            raise UnsupportedOperationError(f"{lit} is not a valid FileType.")
+    filetype = _FILETYPES.get(lit)
+    if filetype is None:
+        raise UnsupportedOperationError(f"{lit} is not a valid FileType.")
+    return filetype
 
 
 def literal_to_writemode(lit: Literal["append", "overwrite"]) -> WriteMode:
-    match lit:
-        case "append":
-            return WriteMode.APPEND
-        case "overwrite":
-            return WriteMode.OVERWRITE
-        case _:
-            raise UnsupportedOperationError(f"{lit} is not a valid WriteMode.")
+    writemode = _WRITEMODES.get(lit)
+    if writemode is None:
+        raise UnsupportedOperationError(f"{lit} is not a valid WriteMode.")
+    return writemode
 
 
 def literal_to_schemaevolution(
     lit: Literal["strict", "merge", "overwrite"]
 ) -> SchemaEvolution:
-    match lit:
-        case "strict":
-            return SchemaEvolution.STRICT
-        case "merge":
-            return SchemaEvolution.MERGE
-        case "overwrite":
-            return SchemaEvolution.OVERWRITE
-        case _:
-            raise UnsupportedOperationError(f"{lit} is not a valid SchemaEvolution.")
+    schemaevolution = _SCHEMAEVOLUTIONS.get(lit)
+    if schemaevolution is None:
+        raise UnsupportedOperationError(f"{lit} is not a valid SchemaEvolution.")
+    return schemaevolution
+
+
+class TTLCache(Generic[K, V]):
+    """
+    A small dict based cache whose entries expire `ttl` seconds after they were stored.
+    Holds at most `maxsize` entries; the oldest entry is evicted first.
+    With `ttl <= 0` nothing is stored, i.e. the cache is disabled.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[K, tuple[float, V]] = {}
+
+    def get(self, key: K) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic(), value)
+
+    def pop(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()